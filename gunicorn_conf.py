@@ -0,0 +1,35 @@
+"""
+gunicorn settings for tz_webhook_server (Procfile: gunicorn -c gunicorn_conf.py tz_webhook_server:app)
+
+One gevent worker on purpose: the dedup cache, /status jobs and the locate
+dispatcher live in process memory, and so does symbol state unless REDIS_URL
+is set — a second worker would run its own copy of all of them. Concurrency
+comes from gevent — each in-flight webhook/TZ call is a greenlet, not a
+blocked worker.
+
+On shutdown the worker abandons queued and in-flight COVER jobs, locates and
+cleanups (see worker_exit) instead of waiting minutes for a locate to finish.
+"""
+import os
+import sys
+
+bind               = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers            = 1
+worker_class       = "gevent"
+worker_connections = 200      # concurrent greenlets (webhooks + /health probes)
+keepalive          = 30       # seconds to hold idle client connections (QC, Render probe)
+timeout            = 30       # heartbeat timeout; gevent keeps it alive during TZ waits
+preload_app        = False    # import the app in the worker so its TZ pool is post-fork
+
+
+def worker_exit(server, worker):
+    # The app's pools are ThreadPoolExecutors, whose workers the interpreter
+    # joins at exit — an in-flight locate would hold the worker until gunicorn
+    # SIGKILLs it. Drop queued work, flush the log queue and exit now, the way
+    # the daemon threads they replaced were simply dropped.
+    app = sys.modules.get("tz_webhook_server")
+    if app is None:
+        return
+    app.shutdown_pools()
+    app._log_listener.stop()
+    os._exit(0)
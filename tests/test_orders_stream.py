@@ -0,0 +1,77 @@
+"""_cached_open_orders: truncated bodies return None, racing fetches are not cached."""
+import io
+import os
+
+os.environ.setdefault("TZ_API_KEY", "test")
+os.environ.setdefault("TZ_API_SECRET", "test")
+
+import urllib3.exceptions
+
+import tz_webhook_server as server
+
+
+class _Raw(io.BytesIO):
+    decode_content = False
+
+
+class _TruncatedRaw(_Raw):
+    """Serves the bytes it has, then fails the way urllib3 does on an IncompleteRead."""
+
+    def read(self, n=-1):
+        data = super().read(n)
+        if not data:
+            raise urllib3.exceptions.ProtocolError("Connection broken: IncompleteRead")
+        return data
+
+
+class _Resp:
+    status_code = 200
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Session:
+    def __init__(self, raw):
+        self.raw = raw
+
+    def get(self, url, **kwargs):
+        return _Resp(self.raw)
+
+
+def _fetch(monkeypatch, raw):
+    monkeypatch.setattr(server, "SESSION", _Session(raw))
+    server._orders_cache.clear()
+    return server._cached_open_orders("ACCT", server.TZ_HEADERS, "ORDERS")
+
+
+def test_truncated_orders_stream_returns_none(monkeypatch):
+    body = b'[{"symbol": "AAPL", "orderStatus": "New", "clientOrderId": "A1"}, {"symbol": "TS'
+    assert _fetch(monkeypatch, _TruncatedRaw(body)) is None
+    assert "ACCT" not in server._orders_cache
+
+
+def test_complete_orders_stream_is_indexed_by_symbol(monkeypatch):
+    body = (b'[{"symbol": "aapl", "orderStatus": "New", "clientOrderId": "A1"},'
+            b' {"symbol": "AAPL", "orderStatus": "Filled", "clientOrderId": "A0"}]')
+    orders = _fetch(monkeypatch, _Raw(body))
+    assert [o["clientOrderId"] for o in orders["AAPL"]] == ["A1"]
+
+
+def test_fetch_straddling_an_invalidation_is_not_cached(monkeypatch):
+    body = b'[{"symbol": "AAPL", "orderStatus": "New", "clientOrderId": "A1"}]'
+
+    class _RacingRaw(_Raw):
+        def read(self, n=-1):
+            server._invalidate_account_cache("ACCT")    # an order lands mid-fetch
+            return super().read(n)
+
+    orders = _fetch(monkeypatch, _RacingRaw(body))
+    assert [o["clientOrderId"] for o in orders["AAPL"]] == ["A1"]
+    assert "ACCT" not in server._orders_cache
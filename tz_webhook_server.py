@@ -23,9 +23,10 @@ ENDPOINTS:
   GET  /sim/state        ← sim account symbol states
   POST /reset/<symbol>   ← manually reset real symbol to FLAT
   POST /sim/reset/<symbol> ← manually reset sim symbol to FLAT
+  GET  /status/<job_id>  ← result of a queued COVER (webhook returns 202 + job_id)
 
 HOW TO RUN:
-  pip install flask requests python-dotenv
+  pip install -r requirements.txt
   .env:
     TZ_API_KEY=...
     TZ_API_SECRET=...
@@ -33,14 +34,39 @@ HOW TO RUN:
     TZ_SIM_API_SECRET=...
     SIM_ACCOUNT_ID=...
     STOP_LOSS_ENABLED=true     # set false to skip broker SL and rely on QC cover
-  python tz_webhook_server.py
+    LOCAL_ONLY=1               # optional: bind 127.0.0.1 only (QC on same host)
+  python tz_webhook_server.py                               # local dev (gevent WSGIServer)
+  gunicorn -c gunicorn_conf.py tz_webhook_server:app        # production (Procfile)
 """
 
-import os, json, uuid, logging, threading, time
-from datetime import date
+# Local `python tz_webhook_server.py` runs are served by gevent (see ENTRYPOINT).
+# Patch blocking I/O before threading/requests/flask are imported so an in-flight
+# TZ call yields instead of stalling /health or a second webhook. Under gunicorn
+# this module is imported, not run, so this block is skipped.
+if __name__ == "__main__":
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        pass
+
+import os, logging, logging.handlers, threading, time, queue, atexit
+import itertools, secrets
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
 from zoneinfo import ZoneInfo
+import fastjsonschema
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3.exceptions
+from urllib3.util.retry import Retry
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -52,10 +78,13 @@ from locate_logger import log_locate, log_rename
 # ══════════════════════════════════════════════════════════════════════════════
 BASE_URL             = "https://webapi.tradezero.com"
 ACCOUNT_ID           = "DHA41998"
+ET_TZ                = ZoneInfo("America/New_York")   # market clock; built once, DST-aware
 MAX_LOCATE_COST_PCT  = 0.1    # 10%  — reject if locatePrice / entryPrice > this
 MIN_LOCATE_QUANTITY  = 100     # TZ minimum locate size
 MIN_SHORT_QUANTITY   = 1       # TZ minimum short order size (any size accepted)
-LOCATE_POLL_INTERVAL = 2       # seconds between locate status polls
+LOCATE_POLL_INTERVAL = 0.5     # seconds before the first re-poll of locate status
+LOCATE_POLL_BACKOFF  = 1.5     # each later wait is ×1.5 (0.5, 0.75, 1.1, 1.7, 2.5, 3 …)
+LOCATE_POLL_MAX_WAIT = 3.0     # cap on the wait between polls
 LOCATE_POLL_TIMEOUT  = 30      # seconds before giving up on locate
 LOCATE_ACCEPT_SLEEP  = 3       # seconds to wait after locate accept before placing order
                                # TZ sends "locateAcceptSent:true" before fully registering
@@ -90,6 +119,21 @@ SL_LIMIT_SLACK  = 0.02    # 2% slack on StopLimit ETH orders so they actually fi
 STOP_LOSS_ENABLED = (os.getenv("STOP_LOSS_ENABLED", "true").strip().lower()
                      not in ("0", "false", "no", "off"))
 
+# ── BULK CANCEL (opt-in) ────────────────────────────────────────────────────
+# True → cancel_all_open_orders first tries one DELETE /orders?symbol=X and
+#         only falls back to per-order DELETEs if TZ answers 404/405/other.
+# Off by default: TZ doesn't document symbol scoping on the bulk DELETE, and
+# if the filter were ignored it would also cancel other symbols' armed stops.
+BULK_CANCEL_ENABLED = (os.getenv("TZ_BULK_CANCEL", "false").strip().lower()
+                       in ("1", "true", "yes", "on"))
+
+# ── SHARED STATE (opt-in) ───────────────────────────────────────────────────
+# Set REDIS_URL to keep symbol_state / sim_symbol_state in Redis instead of
+# process memory, so it survives restarts and is shared by every worker.
+# Entries expire after STATE_TTL as a backstop; the midnight reset still runs.
+REDIS_URL = (os.getenv("REDIS_URL") or "").strip()
+STATE_TTL = 86400
+
 # ── LOCATE BUYING-POWER SIZING ──────────────────────────────────────────────
 # TZ evaluates LOCATE requests against ~1:1 buying power (notional <= BP), NOT
 # the leveraged margin used at order placement (same finding the SIM phantom
@@ -118,16 +162,40 @@ SIM_API_KEY    = (os.getenv("TZ_SIM_API_KEY")   or "").strip()
 SIM_API_SECRET = (os.getenv("TZ_SIM_API_SECRET") or "").strip()
 SIM_ACCOUNT_ID = (os.getenv("SIM_ACCOUNT_ID")    or "").strip()
 
+# Account-scoped order endpoints, formatted once (helpers prepend BASE_URL)
+ORDER_PATH      = f"/v1/api/accounts/{ACCOUNT_ID}/order"
+ORDERS_PATH     = f"/v1/api/accounts/{ACCOUNT_ID}/orders"
+SIM_ORDER_PATH  = f"/v1/api/accounts/{SIM_ACCOUNT_ID}/order"
+SIM_ORDERS_PATH = f"/v1/api/accounts/{SIM_ACCOUNT_ID}/orders"
+
 # ══════════════════════════════════════════════════════════════════════════════
 # LOGGING
 # ══════════════════════════════════════════════════════════════════════════════
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s  %(levelname)-8s  %(message)s",
+# Records are handed to a queue on the calling thread; a single listener
+# thread does the formatting + stdout write, so request handlers never block
+# on log I/O. LOG_LEVEL=DEBUG re-enables the full request/body dumps.
+LOG_LEVEL = (os.getenv("LOG_LEVEL") or "INFO").strip().upper()
+
+_log_queue    = queue.SimpleQueue()
+_log_stream   = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter(
+    fmt="%(asctime)s  %(levelname)-8s  %(message)s",
     datefmt="%H:%M:%S",
-    handlers=[logging.StreamHandler()]
+))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream,
+                                               respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_log_handler = logging.handlers.QueueHandler(_log_queue)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))   # real format is on _log_stream
+
+logging.basicConfig(
+    level=getattr(logging, LOG_LEVEL, logging.INFO),
+    handlers=[_log_handler]
 )
 log = logging.getLogger("tz_server")
+_log_info = log.info    # pre-bound for the per-webhook summary line
 log.info("=== tz_webhook_server module loading ===")
 
 # Suppress gunicorn access log spam from Render's health check pings.
@@ -142,33 +210,213 @@ for _gunicorn_logger in ("gunicorn.access", "gunicorn.error", "werkzeug"):
 # ══════════════════════════════════════════════════════════════════════════════
 # REAL ACCOUNT STATE MACHINE  (reset at midnight)
 # ══════════════════════════════════════════════════════════════════════════════
-symbol_state = {}
-state_lock   = threading.Lock()
-reset_date   = date.today()
+# Locking is per symbol: a locate thread holding AAPL never stalls a webhook
+# for TSLA. _meta_lock only guards the lock registries and the *key sets* of
+# the state dicts (insert / pop / snapshot of keys); lock order is always
+# symbol lock → _meta_lock, never the reverse.
+_meta_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class SymbolState:
+    """One symbol's state-machine entry. Fields not set yet keep their default."""
+    state:                         str = "FLAT"
+    entry_price:                   float = 0.0
+    quantity:                      int = 0
+    client_order_id:               str | None = None
+    quote_req_id:                  str | None = None
+    reason:                        str = ""
+    cycle:                         int = 0
+    sl_pct:                        float | None = None
+    sl_client_order_id:            str | None = None
+    owner:                         str | None = None
+    entry_fill_price:              float | None = None
+    locate_cost_per_share:         float | None = None
+    phantom_locate_cost:           float = 0.0
+    phantom_locate_cost_per_share: float | None = None
+
+
+def _registry_lock(registry, symbol):
+    lk = registry.get(symbol)
+    if lk is None:
+        with _meta_lock:
+            lk = registry.setdefault(symbol, threading.Lock())
+    return lk
+
+
+def _snapshot_states(states, lock_for, prefix):
+    """Copy of every symbol's state, each read under its own symbol lock."""
+    if _redis is not None:
+        return _redis_snapshot(prefix)
+    with _meta_lock:
+        keys = list(states)
+    snap = {}
+    for k in keys:
+        with lock_for(k):
+            v = states.get(k)
+            if v is not None:
+                snap[k] = replace(v)
+    return snap
+
+
+def _clear_states(states, lock_for, prefix):
+    if _redis is not None:
+        _redis_clear(prefix)
+        return
+    with _meta_lock:
+        keys = list(states)
+    for k in keys:
+        with lock_for(k):
+            with _meta_lock:
+                states.pop(k, None)
+
+
+# ── Optional Redis backend ──────────────────────────────────────────────────
+# Each entry is the JSON of a SymbolState under tz:state:{SYMBOL} (sim:
+# tz:sim:state:{SYMBOL}). Every read-modify-write is a Lua script, so the
+# COVERING claim and the LOCATING→ACTIVE CAS stay atomic across processes,
+# not just across threads. The per-symbol locks are then only a local no-op.
+_STATE_KEY     = "tz:state:"
+_SIM_STATE_KEY = "tz:sim:state:"
+_STATE_FIELDS  = frozenset(SymbolState.__dataclass_fields__)
+
+_LUA_MERGE = """
+local v  = redis.call('GET', KEYS[1])
+local st = v and cjson.decode(v) or {state = 'FLAT'}
+for k, val in pairs(cjson.decode(ARGV[1])) do st[k] = val end
+redis.call('SET', KEYS[1], cjson.encode(st), 'EX', ARGV[2])
+return st.state
+"""
+
+_LUA_CAS = """
+local v  = redis.call('GET', KEYS[1])
+local st = v and cjson.decode(v) or {state = 'FLAT'}
+if st.state ~= ARGV[1] then return 0 end
+if ARGV[1] == ARGV[2] and ARGV[3] == '{}' then return 1 end
+st.state = ARGV[2]
+for k, val in pairs(cjson.decode(ARGV[3])) do st[k] = val end
+redis.call('SET', KEYS[1], cjson.encode(st), 'EX', ARGV[4])
+return 1
+"""
+
+_LUA_CLAIM = """
+local v  = redis.call('GET', KEYS[1])
+local st = v and cjson.decode(v) or {state = 'FLAT'}
+if st.state == ARGV[1] then return 0 end
+st.state = ARGV[1]
+redis.call('SET', KEYS[1], cjson.encode(st), 'EX', ARGV[2])
+return 1
+"""
+
+
+def _init_redis():
+    if not REDIS_URL:
+        return None
+    try:
+        import redis
+        client = redis.Redis(connection_pool=redis.BlockingConnectionPool.from_url(
+            REDIS_URL, max_connections=32, timeout=5, decode_responses=True))
+        client.ping()
+    except Exception as e:
+        log.error("REDIS_URL set but Redis unavailable (%s) — symbol state stays in process memory", e)
+        return None
+    log.info("State backend: Redis")
+    return client
+
+
+_redis = _init_redis()
+if _redis is not None:
+    _redis_merge_script = _redis.register_script(_LUA_MERGE)
+    _redis_cas_script   = _redis.register_script(_LUA_CAS)
+    _redis_claim_script = _redis.register_script(_LUA_CLAIM)
+
+
+def _decode_state(raw):
+    d = orjson.loads(raw)
+    return SymbolState(**{k: v for k, v in d.items() if k in _STATE_FIELDS})
+
+
+def _redis_get(prefix, symbol):
+    raw = _redis.get(prefix + symbol)
+    return _decode_state(raw) if raw else SymbolState()
+
+
+def _redis_put(prefix, symbol, st):
+    _redis.set(prefix + symbol, orjson.dumps(asdict(st)), ex=STATE_TTL)
+
+
+def _redis_merge(prefix, symbol, kwargs):
+    return _redis_merge_script(keys=[prefix + symbol],
+                               args=[orjson.dumps(kwargs), STATE_TTL])
+
+
+def _redis_cas(prefix, symbol, expected, new, kwargs):
+    return bool(_redis_cas_script(keys=[prefix + symbol],
+                                  args=[expected, new, orjson.dumps(kwargs), STATE_TTL]))
+
+
+def _redis_claim(prefix, symbol, new):
+    return bool(_redis_claim_script(keys=[prefix + symbol], args=[new, STATE_TTL]))
+
+
+def _redis_snapshot(prefix):
+    keys = list(_redis.scan_iter(match=prefix + "*", count=500))
+    if not keys:
+        return {}
+    return {k[len(prefix):]: _decode_state(v)
+            for k, v in zip(keys, _redis.mget(keys)) if v}
+
+
+def _redis_clear(prefix):
+    keys = list(_redis.scan_iter(match=prefix + "*", count=500))
+    if keys:
+        _redis.delete(*keys)
+
+
+symbol_state  = {}
+_symbol_locks = {}      # symbol → threading.Lock (created on first use)
+reset_date    = date.today()
+
+
+def _lock_for(symbol):
+    return _registry_lock(_symbol_locks, symbol)
 
 
 def get_state(symbol):
-    with state_lock:
-        return symbol_state.get(symbol, {}).copy()
+    if _redis is not None:
+        return _redis_get(_STATE_KEY, symbol)
+    with _lock_for(symbol):
+        st = symbol_state.get(symbol)
+        return replace(st) if st is not None else SymbolState()
 
 
 def set_state(symbol, **kwargs):
-    with state_lock:
-        if symbol not in symbol_state:
-            symbol_state[symbol] = {"state": "FLAT"}
-        symbol_state[symbol].update(kwargs)
-    log.info(f"[{symbol}] STATE → {symbol_state[symbol]['state']}"
-             + (f" ({kwargs.get('reason', '')})" if kwargs.get("reason") else ""))
+    if _redis is not None:
+        new_state = _redis_merge(_STATE_KEY, symbol, kwargs)
+    else:
+        with _lock_for(symbol):
+            st = symbol_state.get(symbol)
+            if st is None:
+                st = SymbolState()
+                with _meta_lock:
+                    symbol_state[symbol] = st
+            for k, v in kwargs.items():
+                setattr(st, k, v)
+            new_state = st.state
+    if kwargs.get("reason"):
+        log.info("[%s] STATE → %s (%s)", symbol, new_state, kwargs["reason"])
+    else:
+        log.info("[%s] STATE → %s", symbol, new_state)
 
 
 def block(symbol, reason):
-    last_cycle = symbol_state.get(symbol, {}).get("cycle", 0)
+    last_cycle = get_state(symbol).cycle
     set_state(symbol, state="BLOCKED", reason=reason, cycle=last_cycle)
-    log.warning(f"[{symbol}] BLOCKED: {reason}")
+    log.warning("[%s] BLOCKED: %s", symbol, reason)
 
 
 def try_begin_cover(symbol):
-    """Atomically claim the cover for `symbol` under the state lock.
+    """Atomically claim the cover for `symbol` under its symbol lock.
 
     Returns True if this caller won the claim (proceed to place the buy),
     False if a cover is already in progress (caller must bail). This is the
@@ -179,67 +427,155 @@ def try_begin_cover(symbol):
     atomic (same lock acquisition), or two simultaneous covers both pass a
     separate get_state()/set_state() and the race survives.
     """
-    with state_lock:
-        st = symbol_state.get(symbol, {}).get("state")
-        if st == "COVERING":
+    if _redis is not None:
+        if not _redis_claim(_STATE_KEY, symbol, "COVERING"):
+            return False
+        log.info("[%s] STATE → COVERING", symbol)
+        return True
+    with _lock_for(symbol):
+        st = symbol_state.get(symbol)
+        if st is not None and st.state == "COVERING":
             return False
-        if symbol not in symbol_state:
-            symbol_state[symbol] = {"state": "FLAT"}
-        symbol_state[symbol]["state"] = "COVERING"
-    log.info(f"[{symbol}] STATE → COVERING")
+        if st is None:
+            st = SymbolState()
+            with _meta_lock:
+                symbol_state[symbol] = st
+        st.state = "COVERING"
+    log.info("[%s] STATE → COVERING", symbol)
+    return True
+
+
+def cas_state(symbol, expected, new, **fields):
+    """Compare-and-swap: move `symbol` from `expected` to `new` (and apply
+    `fields`) only if it is still in `expected`, as one lock acquisition.
+
+    Returns False, changing nothing, if the state moved underneath the caller.
+    cas_state(sym, "LOCATING", "LOCATING") is a pure check that the locate
+    still owns the symbol.
+    """
+    if _redis is not None:
+        if not _redis_cas(_STATE_KEY, symbol, expected, new, fields):
+            return False
+    else:
+        with _lock_for(symbol):
+            st = symbol_state.get(symbol)
+            if (st.state if st is not None else "FLAT") != expected:
+                return False
+            if st is None:
+                st = SymbolState()
+                with _meta_lock:
+                    symbol_state[symbol] = st
+            st.state = new
+            for k, v in fields.items():
+                setattr(st, k, v)
+    if new != expected:
+        log.info("[%s] STATE → %s", symbol, new)
     return True
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # SIM ACCOUNT STATE MACHINE  (separate dict — never collides with real states)
 # ══════════════════════════════════════════════════════════════════════════════
-sim_symbol_state = {}
-sim_state_lock   = threading.Lock()
+sim_symbol_state  = {}
+_sim_symbol_locks = {}
+
+
+def _sim_lock_for(symbol):
+    return _registry_lock(_sim_symbol_locks, symbol)
 
 
 def sim_get_state(symbol):
-    with sim_state_lock:
-        return sim_symbol_state.get(symbol, {}).copy()
+    if _redis is not None:
+        return _redis_get(_SIM_STATE_KEY, symbol)
+    with _sim_lock_for(symbol):
+        st = sim_symbol_state.get(symbol)
+        return replace(st) if st is not None else SymbolState()
 
 
 def sim_set_state(symbol, **kwargs):
-    with sim_state_lock:
-        if symbol not in sim_symbol_state:
-            sim_symbol_state[symbol] = {"state": "FLAT"}
-        sim_symbol_state[symbol].update(kwargs)
-    log.info(f"[SIM:{symbol}] STATE → {sim_symbol_state[symbol]['state']}"
-             + (f" ({kwargs.get('reason', '')})" if kwargs.get("reason") else ""))
+    if _redis is not None:
+        new_state = _redis_merge(_SIM_STATE_KEY, symbol, kwargs)
+    else:
+        with _sim_lock_for(symbol):
+            st = sim_symbol_state.get(symbol)
+            if st is None:
+                st = SymbolState()
+                with _meta_lock:
+                    sim_symbol_state[symbol] = st
+            for k, v in kwargs.items():
+                setattr(st, k, v)
+            new_state = st.state
+    if kwargs.get("reason"):
+        log.info("[SIM:%s] STATE → %s (%s)", symbol, new_state, kwargs["reason"])
+    else:
+        log.info("[SIM:%s] STATE → %s", symbol, new_state)
 
 
 def sim_block(symbol, reason):
-    last_cycle = sim_symbol_state.get(symbol, {}).get("cycle", 0)
+    last_cycle = sim_get_state(symbol).cycle
     sim_set_state(symbol, state="BLOCKED", reason=reason, cycle=last_cycle)
-    log.warning(f"[SIM:{symbol}] BLOCKED: {reason}")
+    log.warning("[SIM:%s] BLOCKED: %s", symbol, reason)
 
 
 def sim_try_begin_cover(symbol):
     """Atomically claim the sim cover for `symbol` (see try_begin_cover)."""
-    with sim_state_lock:
-        st = sim_symbol_state.get(symbol, {}).get("state")
-        if st == "COVERING":
+    if _redis is not None:
+        if not _redis_claim(_SIM_STATE_KEY, symbol, "COVERING"):
+            return False
+        log.info("[SIM:%s] STATE → COVERING", symbol)
+        return True
+    with _sim_lock_for(symbol):
+        st = sim_symbol_state.get(symbol)
+        if st is not None and st.state == "COVERING":
+            return False
+        if st is None:
+            st = SymbolState()
+            with _meta_lock:
+                sim_symbol_state[symbol] = st
+        st.state = "COVERING"
+    log.info("[SIM:%s] STATE → COVERING", symbol)
+    return True
+
+
+def sim_cas_state(symbol, expected, new, **fields):
+    """Sim compare-and-swap state transition (see cas_state)."""
+    if _redis is not None:
+        if not _redis_cas(_SIM_STATE_KEY, symbol, expected, new, fields):
             return False
-        if symbol not in sim_symbol_state:
-            sim_symbol_state[symbol] = {"state": "FLAT"}
-        sim_symbol_state[symbol]["state"] = "COVERING"
-    log.info(f"[SIM:{symbol}] STATE → COVERING")
+    else:
+        with _sim_lock_for(symbol):
+            st = sim_symbol_state.get(symbol)
+            if (st.state if st is not None else "FLAT") != expected:
+                return False
+            if st is None:
+                st = SymbolState()
+                with _meta_lock:
+                    sim_symbol_state[symbol] = st
+            st.state = new
+            for k, v in fields.items():
+                setattr(st, k, v)
+    if new != expected:
+        log.info("[SIM:%s] STATE → %s", symbol, new)
     return True
 
 
+def _seconds_until_midnight():
+    """Seconds from now until 00:00:05 local time tomorrow."""
+    now      = datetime.now()
+    tomorrow = (now + timedelta(days=1)).replace(hour=0, minute=0, second=5, microsecond=0)
+    return (tomorrow - now).total_seconds()
+
+
 def midnight_reset_thread():
+    # One sleep per day instead of a 30s poll. The date check stays so a
+    # short/early wakeup can never clear state mid-session.
     global reset_date
     while True:
-        time.sleep(30)
+        time.sleep(_seconds_until_midnight())
         today = date.today()
         if today != reset_date:
-            with state_lock:
-                symbol_state.clear()
-            with sim_state_lock:
-                sim_symbol_state.clear()
+            _clear_states(symbol_state, _lock_for, _STATE_KEY)
+            _clear_states(sim_symbol_state, _sim_lock_for, _SIM_STATE_KEY)
             reset_date = today
             log.info("MIDNIGHT RESET: all symbol states cleared (real + sim)")
 
@@ -286,136 +622,404 @@ def self_watchdog_thread():
 threading.Thread(target=self_watchdog_thread, daemon=True).start()
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# HTTP SESSION  (shared keep-alive pool for every TZ API call, real + sim)
+# ══════════════════════════════════════════════════════════════════════════════
+# A bare requests.get/post opens a fresh TCP+TLS connection per call. One
+# module-level Session keeps the connection to webapi.tradezero.com alive, so
+# order POSTs and locate polls after the first skip the TLS handshake. urllib3's
+# pool is thread-safe, so locate/monitor threads and Flask handlers share it.
+# Retry only applies to idempotent methods (urllib3 default) — an order POST is
+# never resent automatically. raise_on_status=False hands the final 5xx back to
+# the caller so the existing status-code checks still see it.
+def _new_session():
+    session = requests.Session()
+    # pool_maxsize covers locate pollers + monitors + the cancel/order pools all
+    # hitting TZ at once without any of them opening a throwaway connection.
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                          raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _reset_session_after_fork():
+    # A forked child must never reuse the parent's pooled sockets (two
+    # processes reading one TLS stream hangs both). Only matters if the app
+    # is ever preloaded before gunicorn forks; harmless otherwise.
+    global SESSION
+    SESSION = _new_session()
+
+
+SESSION = _new_session()
+os.register_at_fork(after_in_child=_reset_session_after_fork)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # REAL ACCOUNT — TZ API HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
+# Built once — the credentials never change after startup. Read-only so no
+# call site can mutate the shared copy.
+TZ_HEADERS = MappingProxyType({
+    "TZ-API-KEY-ID":     API_KEY,
+    "TZ-API-SECRET-KEY": API_SECRET,
+    "Content-Type":      "application/json",
+    "Accept":            "application/json",
+})
+
+
 def tz_headers():
-    return {
-        "TZ-API-KEY-ID":     API_KEY,
-        "TZ-API-SECRET-KEY": API_SECRET,
-        "Content-Type":      "application/json",
-        "Accept":            "application/json",
-    }
+    return TZ_HEADERS
 
 
 def tz_get(path, label="GET"):
     url = f"{BASE_URL}{path}"
-    log.info(f"  → {label} GET {url}")
-    r = requests.get(url, headers=tz_headers(), timeout=15)
-    log.info(f"  ← status: {r.status_code}  body: {r.text[:600]}")
+    log.info("  → %s GET %s", label, url)
+    r = SESSION.get(url, headers=TZ_HEADERS, timeout=15, stream=False)
+    log.info("  ← status: %s", r.status_code)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    body: %s", r.content[:600].decode("utf-8", "replace"))
     return r
 
 
 def tz_post(path, payload, label="POST"):
     url = f"{BASE_URL}{path}"
-    log.info(f"  → {label} POST {url}")
-    log.info(f"    body: {json.dumps(payload)}")
-    r = requests.post(url, headers=tz_headers(), json=payload, timeout=15)
-    log.info(f"  ← status: {r.status_code}  body: {r.text[:600]}")
+    log.info("  → %s POST %s", label, url)
+    body = orjson.dumps(payload)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    body: %s", body.decode())
+    r = SESSION.post(url, headers=TZ_HEADERS, data=body, timeout=15, stream=False)
+    log.info("  ← status: %s", r.status_code)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    body: %s", r.content[:600].decode("utf-8", "replace"))
     return r
 
 
 def tz_delete(path, label="DELETE"):
     url = f"{BASE_URL}{path}"
-    log.info(f"  → {label} DELETE {url}")
-    r = requests.delete(url, headers=tz_headers(), timeout=15)
-    log.info(f"  ← status: {r.status_code}  body: {r.text[:200]}")
+    log.info("  → %s DELETE %s", label, url)
+    r = SESSION.delete(url, headers=TZ_HEADERS, timeout=15, stream=False)
+    log.info("  ← status: %s", r.status_code)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    body: %s", r.content[:200].decode("utf-8", "replace"))
     return r
 
 
+def _prewarm_tz_connection():
+    """Open the pooled TLS connection to TZ at boot so the first webhook's
+    order doesn't pay the handshake. Result is ignored — failures are harmless,
+    the first real call simply connects on its own.
+    """
+    try:
+        SESSION.get(f"{BASE_URL}/v1/api/accounts/{ACCOUNT_ID}/positions",
+                    headers=TZ_HEADERS, timeout=10)
+    except Exception:
+        pass
+
+
+# Started at import (not in __main__) so it also runs under gunicorn.
+threading.Thread(target=_prewarm_tz_connection, daemon=True).start()
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # SIM ACCOUNT — TZ API HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
+SIM_HEADERS = MappingProxyType({
+    "TZ-API-KEY-ID":     SIM_API_KEY,
+    "TZ-API-SECRET-KEY": SIM_API_SECRET,
+    "Content-Type":      "application/json",
+    "Accept":            "application/json",
+})
+
+
 def sim_headers():
-    return {
-        "TZ-API-KEY-ID":     SIM_API_KEY,
-        "TZ-API-SECRET-KEY": SIM_API_SECRET,
-        "Content-Type":      "application/json",
-        "Accept":            "application/json",
-    }
+    return SIM_HEADERS
 
 
 def sim_tz_get(path, label="GET"):
     url = f"{BASE_URL}{path}"
-    log.info(f"  → [SIM] {label} GET {url}")
-    r = requests.get(url, headers=sim_headers(), timeout=15)
-    log.info(f"  ← [SIM] status: {r.status_code}  body: {r.text[:600]}")
+    log.info("  → [SIM] %s GET %s", label, url)
+    r = SESSION.get(url, headers=SIM_HEADERS, timeout=15, stream=False)
+    log.info("  ← [SIM] status: %s", r.status_code)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    body: %s", r.content[:600].decode("utf-8", "replace"))
     return r
 
 
 def sim_tz_post(path, payload, label="POST"):
     url = f"{BASE_URL}{path}"
-    log.info(f"  → [SIM] {label} POST {url}")
-    log.info(f"    body: {json.dumps(payload)}")
-    r = requests.post(url, headers=sim_headers(), json=payload, timeout=15)
-    log.info(f"  ← [SIM] status: {r.status_code}  body: {r.text[:600]}")
+    log.info("  → [SIM] %s POST %s", label, url)
+    body = orjson.dumps(payload)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    body: %s", body.decode())
+    r = SESSION.post(url, headers=SIM_HEADERS, data=body, timeout=15, stream=False)
+    log.info("  ← [SIM] status: %s", r.status_code)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    body: %s", r.content[:600].decode("utf-8", "replace"))
     return r
 
 
 def sim_tz_delete(path, label="DELETE"):
     url = f"{BASE_URL}{path}"
-    log.info(f"  → [SIM] {label} DELETE {url}")
-    r = requests.delete(url, headers=sim_headers(), timeout=15)
-    log.info(f"  ← [SIM] status: {r.status_code}  body: {r.text[:200]}")
+    log.info("  → [SIM] %s DELETE %s", label, url)
+    r = SESSION.delete(url, headers=SIM_HEADERS, timeout=15, stream=False)
+    log.info("  ← [SIM] status: %s", r.status_code)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    body: %s", r.content[:200].decode("utf-8", "replace"))
     return r
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# REAL ACCOUNT — ACCOUNT / POSITION / ORDER HELPERS
+# ORDER / POSITION CACHE + CANCEL POOL  (shared by real + sim helpers)
 # ══════════════════════════════════════════════════════════════════════════════
-def get_account_details():
-    r = tz_get(f"/v1/api/account/{ACCOUNT_ID}", "ACCOUNT")
-    if r.status_code == 200:
-        return r.json()
-    log.error(f"  Failed to get account details: {r.status_code}")
-    return None
+# A burst of SHORTs at the close shares one buying-power read. Orders and
+# positions are indexed by upper-cased symbol once per fetch, so each lookup is a dict get rather than a list scan. Any
+# order placement or cancel on the account drops every entry and bumps the
+# account's generation; a fetch that started before the bump is returned to
+# its caller but never stored, so a cached view never hides an order — or a
+# fill — this process just caused. Cancel sweeps bypass the orders cache
+# entirely: they must act on a list newer than the last order placement, and
+# cover / cleanup paths read positions with fresh=True for the same reason —
+# a fill TZ reports after the last cached GET is invisible to this process.
+#
+# The orders GET returns the whole day's history (hundreds of filled/cancelled
+# rows on a busy day), so it is stream-parsed with ijson and only open orders
+# are ever materialized or cached.
+ORDERS_CACHE_TTL    = 1.0       # seconds an orders list is reused
+POSITIONS_CACHE_TTL = 1.0       # seconds a positions list is reused
+ACCOUNT_CACHE_TTL   = 2.0       # seconds account details (buying power) are reused
+_OPEN_STATUSES      = frozenset({"PendingNew", "New", "PartiallyFilled", "Submitted"})
+
+_orders_cache      = {}         # account_id → (monotonic ts, {SYMBOL: [open orders]})
+_positions_cache   = {}         # account_id → (monotonic ts, {SYMBOL: position})
+_cache_gen         = {}         # account_id → int, bumped by _invalidate_account_cache
+_orders_cache_lock = threading.Lock()   # guards both caches + _cache_gen
+_account_cache     = {}         # account_id → (monotonic ts, account details dict)
+_account_lock      = threading.Lock()
+_cancel_pool       = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tz-cancel")
+_cancel_locks      = {}         # (account_id, SYMBOL) → Lock, one cancel sweep at a time
+_cleanup_locks     = {}         # (account_id, SYMBOL) → Lock, one cancel+cleanup at a time
+
+
+def _iter_open_orders(stream):
+    """Yield open orders from a TZ orders body — a bare array or {"orders": [...]}
+    — one object at a time, skipping everything not in _OPEN_STATUSES.
+    """
+    builder = item_prefix = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is None:
+            if event == "start_map" and prefix in ("item", "orders.item"):
+                builder, item_prefix = ijson.ObjectBuilder(), prefix
+                builder.event(event, value)
+            continue
+        builder.event(event, value)
+        if event == "end_map" and prefix == item_prefix:
+            if builder.value.get("orderStatus", "") in _OPEN_STATUSES:
+                yield builder.value
+            builder = None
+
 
+def _cache_generation(account_id):
+    with _orders_cache_lock:
+        return _cache_gen.get(account_id, 0)
+
+
+def _cache_store(cache, account_id, gen, value):
+    """Store value in cache unless account_id was invalidated since `gen` was
+    read — a fetch that straddled an order placement must not outlive it.
+    """
+    with _orders_cache_lock, _account_lock:
+        if _cache_gen.get(account_id, 0) == gen:
+            cache[account_id] = (time.monotonic(), value)
+
+
+def _cached_open_orders(account_id, headers, label, fresh=False):
+    """Open orders for account_id as {SYMBOL: [orders]}, reusing a fetch from
+    the last ORDERS_CACHE_TTL seconds unless `fresh`. Returns None on
+    fetch/parse failure.
+    """
+    with _orders_cache_lock:
+        hit = _orders_cache.get(account_id)
+        gen = _cache_gen.get(account_id, 0)
+    if not fresh and hit and time.monotonic() - hit[0] < ORDERS_CACHE_TTL:
+        return hit[1]
+    url = f"{BASE_URL}/v1/api/accounts/{account_id}/orders"
+    log.info("  → %s GET %s (streamed)", label, url)
+    try:
+        with SESSION.get(url, headers=headers, stream=True, timeout=15) as r:
+            log.info("  ← status: %s", r.status_code)
+            if r.status_code != 200:
+                log.error("  Failed to fetch orders (%s): %s", label, r.status_code)
+                return None
+            r.raw.decode_content = True     # let urllib3 undo gzip before ijson
+            orders = {}
+            for o in _iter_open_orders(r.raw):
+                orders.setdefault(str(o.get("symbol", "")).upper(), []).append(o)
+    # r.raw is read directly, so a truncated / timed-out body surfaces as a
+    # urllib3 error (ProtocolError, ReadTimeoutError), not a requests one.
+    except (ijson.JSONError, requests.RequestException, urllib3.exceptions.HTTPError) as e:
+        log.error("  Failed to read orders (%s): %s", label, e)
+        return None
+    _cache_store(_orders_cache, account_id, gen, orders)
+    return orders
 
-def get_position(symbol):
-    r = tz_get(f"/v1/api/accounts/{ACCOUNT_ID}/positions", "POSITIONS")
+
+def _cached_positions(account_id, get_fn, label, fresh=False):
+    """Positions for account_id via get_fn (tz_get / sim_tz_get) as
+    {SYMBOL: position}, reusing a fetch from the last POSITIONS_CACHE_TTL
+    seconds unless `fresh`. Returns None on fetch failure.
+    """
+    with _orders_cache_lock:
+        hit = _positions_cache.get(account_id)
+        gen = _cache_gen.get(account_id, 0)
+    if not fresh and hit and time.monotonic() - hit[0] < POSITIONS_CACHE_TTL:
+        return hit[1]
+    r = get_fn(f"/v1/api/accounts/{account_id}/positions", label)
     if r.status_code != 200:
-        log.error(f"  Failed to get positions: {r.status_code}")
+        log.error("  Failed to get positions (%s): %s", label, r.status_code)
         return None
     positions = r.json()
     if not isinstance(positions, list):
         positions = positions.get("positions", [])
-    for p in positions:
-        if p.get("symbol", "").upper() == symbol.upper():
-            log.info(f"  Found position for {symbol}: {json.dumps(p)}")
-            return p
-    log.info(f"  No open position found for {symbol}")
+    by_symbol = {p["symbol"].upper(): p for p in positions if p.get("symbol")}
+    _cache_store(_positions_cache, account_id, gen, by_symbol)
+    return by_symbol
+
+
+def _cached_account(account_id, get_fn, label):
+    """Account details via get_fn, reusing a fetch from the last
+    ACCOUNT_CACHE_TTL seconds — a burst of SHORTs at the close shares one
+    buying-power read. Returns a copy, or None on fetch failure.
+    """
+    gen = _cache_generation(account_id)
+    with _account_lock:
+        hit = _account_cache.get(account_id)
+    if hit and time.monotonic() - hit[0] < ACCOUNT_CACHE_TTL:
+        return dict(hit[1])
+    r = get_fn(f"/v1/api/account/{account_id}", label)
+    if r.status_code != 200:
+        log.error("  Failed to get account details (%s): %s", label, r.status_code)
+        return None
+    data = r.json()
+    _cache_store(_account_cache, account_id, gen, data)
+    return dict(data)
+
+
+def _invalidate_account_cache(account_id):
+    """Drop every cached view of account_id and bump its generation — called
+    after each order placement or cancel, since any of them can move
+    positions / buying power. Fetches already in flight will not be stored.
+    """
+    with _orders_cache_lock:
+        _cache_gen[account_id] = _cache_gen.get(account_id, 0) + 1
+        _orders_cache.pop(account_id, None)
+        _positions_cache.pop(account_id, None)
+    with _account_lock:
+        _account_cache.pop(account_id, None)
+
+
+def _cancel_lock_for(account_id, symbol):
+    return _registry_lock(_cancel_locks, (account_id, symbol.upper()))
+
+
+def _cleanup_lock_for(account_id, symbol):
+    return _registry_lock(_cleanup_locks, (account_id, symbol.upper()))
+
+
+def _cancel_parallel(cancel_fn, oids):
+    """Run cancel_fn(oid) for every oid on _cancel_pool; count the successes."""
+    futures = [_cancel_pool.submit(cancel_fn, oid) for oid in oids]
+    return sum(1 for f in as_completed(futures) if f.result())
+
+
+def _try_bulk_cancel(orders_path, delete_fn, symbol, label):
+    """One DELETE {orders_path}?symbol=… when BULK_CANCEL_ENABLED.
+    Returns True if TZ accepted it; False means use the per-order path.
+    """
+    if not BULK_CANCEL_ENABLED:
+        return False
+    r = delete_fn(f"{orders_path}?symbol={symbol}", label)
+    if r.status_code in (200, 204):
+        log.info("  [%s] Bulk cancel accepted (%s) — 1 request", symbol, label)
+        return True
+    log.info("  [%s] Bulk cancel unavailable (%s → %s) — falling back to per-order DELETEs",
+             symbol, label, r.status_code)
+    return False
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# REAL ACCOUNT — ACCOUNT / POSITION / ORDER HELPERS
+# ══════════════════════════════════════════════════════════════════════════════
+# clientOrderId suffix: 6-hex (3-byte) per-process nonce + 6-hex sequence, and
+# no urandom read per order. The sequence is never masked, so ids stay unique
+# within a process (past 16.7M orders it just grows a digit); the nonce makes a
+# same-day collision across restarts ~1 in 16.7M, where a repeated Day_Plus id
+# would get live orders rejected by TZ. Shared by real + sim (and the SL_
+# stops) so ids never repeat across accounts either.
+_ORDER_NONCE = secrets.token_hex(3).upper()
+_ORDER_SEQ   = itertools.count()
+
+
+def _next_order_suffix():
+    return f"{_ORDER_NONCE}{next(_ORDER_SEQ):06X}"
+
+
+def get_account_details():
+    return _cached_account(ACCOUNT_ID, tz_get, "ACCOUNT")
+
+
+def get_position(symbol, fresh=False):
+    """TZ position for symbol, or None. Pass fresh=True anywhere the answer
+    decides whether to buy shares back — the cache cannot see a recent fill.
+    """
+    positions = _cached_positions(ACCOUNT_ID, tz_get, "POSITIONS", fresh)
+    if positions is None:
+        return None
+    p = positions.get(symbol.upper())
+    if p:
+        if log.isEnabledFor(logging.INFO):
+            log.info("  Found position for %s: %s", symbol, orjson.dumps(p).decode())
+        return p
+    log.info("  No open position found for %s", symbol)
     return None
 
 
+def cancel_order(oid):
+    """Cancel one real order by clientOrderId. Returns True on success."""
+    rc = tz_delete(f"/v1/api/accounts/{ACCOUNT_ID}/orders/{oid}", "CANCEL_ORDER")
+    if rc.status_code in (200, 204):
+        return True
+    log.warning("  Failed to cancel order %s: %s", oid, rc.status_code)
+    return False
+
+
 def cancel_all_open_orders(symbol):
-    r = tz_get(f"/v1/api/accounts/{ACCOUNT_ID}/orders", "ORDERS")
-    if r.status_code != 200:
-        log.error(f"  Failed to fetch orders: {r.status_code}")
-        return 0
-    orders = r.json()
-    if not isinstance(orders, list):
-        orders = orders.get("orders", [])
-    open_statuses = {"PendingNew", "New", "PartiallyFilled", "Submitted"}
-    open_orders = [
-        o for o in orders
-        if o.get("symbol", "").upper() == symbol.upper()
-        and o.get("orderStatus", "") in open_statuses
-    ]
-    log.info(f"  Found {len(open_orders)} open order(s) for {symbol}")
-    cancelled = 0
-    for o in open_orders:
-        oid = o.get("clientOrderId")
-        if oid:
-            rc = tz_delete(f"/v1/api/accounts/{ACCOUNT_ID}/orders/{oid}", "CANCEL_ORDER")
-            if rc.status_code in (200, 204):
-                cancelled += 1
-            else:
-                log.warning(f"  Failed to cancel order {oid}: {rc.status_code}")
-    return cancelled
+    # Serialized per symbol: a webhook CANCEL and a monitor cleanup for the
+    # same ticker must not both DELETE the same orders.
+    with _cancel_lock_for(ACCOUNT_ID, symbol):
+        orders = _cached_open_orders(ACCOUNT_ID, TZ_HEADERS, "ORDERS", fresh=True)
+        if orders is None:
+            return 0
+        open_orders = orders.get(symbol.upper(), [])
+        log.info("  Found %s open order(s) for %s", len(open_orders), symbol)
+        oids = [o.get("clientOrderId") for o in open_orders if o.get("clientOrderId")]
+        if not oids:
+            return 0
+        if _try_bulk_cancel(ORDERS_PATH, tz_delete, symbol, "BULK_CANCEL"):
+            _invalidate_account_cache(ACCOUNT_ID)
+            return len(oids)
+        # DELETEs go out in parallel over the pooled session: ~1 RTT instead of N.
+        cancelled = _cancel_parallel(cancel_order, oids)
+        _invalidate_account_cache(ACCOUNT_ID)
+        return cancelled
 
 
 def place_order(side, symbol, quantity, limit_price, label="ORDER"):
-    client_id = f"QC_{side[:1].upper()}_{uuid.uuid4().hex[:8].upper()}"
+    client_id = f"QC_{side[:1].upper()}_{_next_order_suffix()}"
     side_str = "Sell" if side.lower() == "sell" else "Buy"
     payload = {
         "clientOrderId": client_id,
@@ -428,13 +1032,14 @@ def place_order(side, symbol, quantity, limit_price, label="ORDER"):
         "timeInForce":   "Day_Plus",
         "route":         "SMART",
     }
-    r = tz_post(f"/v1/api/accounts/{ACCOUNT_ID}/order", payload, label)
+    r = tz_post(ORDER_PATH, payload, label)
+    _invalidate_account_cache(ACCOUNT_ID)
     if not r.ok:
-        log.error(f"  [{symbol}] Order FAILED {r.status_code} — raw body: {r.text[:500]}")
+        log.error("  [%s] Order FAILED %s — raw body: %s", symbol, r.status_code, r.text[:500])
         r.raise_for_status()
     data = r.json()
-    log.info(f"  [{symbol}] Order placed: clientOrderId={data.get('clientOrderId')} "
-             f"status={data.get('orderStatus')}")
+    log.info("  [%s] Order placed: clientOrderId=%s status=%s",
+             symbol, data.get('clientOrderId'), data.get('orderStatus'))
     return data
 
 
@@ -442,60 +1047,53 @@ def place_order(side, symbol, quantity, limit_price, label="ORDER"):
 # SIM ACCOUNT — ACCOUNT / POSITION / ORDER HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
 def sim_get_account_details():
-    r = sim_tz_get(f"/v1/api/account/{SIM_ACCOUNT_ID}", "SIM_ACCOUNT")
-    if r.status_code == 200:
-        return r.json()
-    log.error(f"  [SIM] Failed to get account details: {r.status_code}")
-    return None
+    return _cached_account(SIM_ACCOUNT_ID, sim_tz_get, "SIM_ACCOUNT")
 
 
-def sim_get_position(symbol):
-    r = sim_tz_get(f"/v1/api/accounts/{SIM_ACCOUNT_ID}/positions", "SIM_POSITIONS")
-    if r.status_code != 200:
-        log.error(f"  [SIM] Failed to get positions: {r.status_code}")
+def sim_get_position(symbol, fresh=False):
+    positions = _cached_positions(SIM_ACCOUNT_ID, sim_tz_get, "SIM_POSITIONS", fresh)
+    if positions is None:
         return None
-    positions = r.json()
-    if not isinstance(positions, list):
-        positions = positions.get("positions", [])
-    for p in positions:
-        if p.get("symbol", "").upper() == symbol.upper():
-            log.info(f"  [SIM] Found position for {symbol}: {json.dumps(p)}")
-            return p
-    log.info(f"  [SIM] No open position found for {symbol}")
+    p = positions.get(symbol.upper())
+    if p:
+        if log.isEnabledFor(logging.INFO):
+            log.info("  [SIM] Found position for %s: %s", symbol, orjson.dumps(p).decode())
+        return p
+    log.info("  [SIM] No open position found for %s", symbol)
     return None
 
 
+def sim_cancel_order(oid):
+    """Cancel one sim order by clientOrderId. Returns True on success."""
+    rc = sim_tz_delete(
+        f"/v1/api/accounts/{SIM_ACCOUNT_ID}/orders/{oid}", "SIM_CANCEL_ORDER"
+    )
+    if rc.status_code in (200, 204):
+        return True
+    log.warning("  [SIM] Failed to cancel %s: %s", oid, rc.status_code)
+    return False
+
+
 def sim_cancel_all_open_orders(symbol):
-    r = sim_tz_get(f"/v1/api/accounts/{SIM_ACCOUNT_ID}/orders", "SIM_ORDERS")
-    if r.status_code != 200:
-        log.error(f"  [SIM] Failed to fetch orders: {r.status_code}")
-        return 0
-    orders = r.json()
-    if not isinstance(orders, list):
-        orders = orders.get("orders", [])
-    open_statuses = {"PendingNew", "New", "PartiallyFilled", "Submitted"}
-    open_orders = [
-        o for o in orders
-        if o.get("symbol", "").upper() == symbol.upper()
-        and o.get("orderStatus", "") in open_statuses
-    ]
-    log.info(f"  [SIM] Found {len(open_orders)} open order(s) for {symbol}")
-    cancelled = 0
-    for o in open_orders:
-        oid = o.get("clientOrderId")
-        if oid:
-            rc = sim_tz_delete(
-                f"/v1/api/accounts/{SIM_ACCOUNT_ID}/orders/{oid}", "SIM_CANCEL_ORDER"
-            )
-            if rc.status_code in (200, 204):
-                cancelled += 1
-            else:
-                log.warning(f"  [SIM] Failed to cancel {oid}: {rc.status_code}")
-    return cancelled
+    with _cancel_lock_for(SIM_ACCOUNT_ID, symbol):
+        orders = _cached_open_orders(SIM_ACCOUNT_ID, SIM_HEADERS, "SIM_ORDERS", fresh=True)
+        if orders is None:
+            return 0
+        open_orders = orders.get(symbol.upper(), [])
+        log.info("  [SIM] Found %s open order(s) for %s", len(open_orders), symbol)
+        oids = [o.get("clientOrderId") for o in open_orders if o.get("clientOrderId")]
+        if not oids:
+            return 0
+        if _try_bulk_cancel(SIM_ORDERS_PATH, sim_tz_delete, symbol, "SIM_BULK_CANCEL"):
+            _invalidate_account_cache(SIM_ACCOUNT_ID)
+            return len(oids)
+        cancelled = _cancel_parallel(sim_cancel_order, oids)
+        _invalidate_account_cache(SIM_ACCOUNT_ID)
+        return cancelled
 
 
 def sim_place_order(side, symbol, quantity, limit_price, label="SIM_ORDER"):
-    client_id = f"SIM_{side[:1].upper()}_{uuid.uuid4().hex[:8].upper()}"
+    client_id = f"SIM_{side[:1].upper()}_{_next_order_suffix()}"
     side_str  = "Sell" if side.lower() == "sell" else "Buy"
     payload = {
         "clientOrderId": client_id,
@@ -508,13 +1106,14 @@ def sim_place_order(side, symbol, quantity, limit_price, label="SIM_ORDER"):
         "timeInForce":   "Day_Plus",
         "route":         "SMART",
     }
-    r = sim_tz_post(f"/v1/api/accounts/{SIM_ACCOUNT_ID}/order", payload, label)
+    r = sim_tz_post(SIM_ORDER_PATH, payload, label)
+    _invalidate_account_cache(SIM_ACCOUNT_ID)
     if not r.ok:
-        log.error(f"  [SIM:{symbol}] Order FAILED {r.status_code} — body: {r.text[:500]}")
+        log.error("  [SIM:%s] Order FAILED %s — body: %s", symbol, r.status_code, r.text[:500])
         r.raise_for_status()
     data = r.json()
-    log.info(f"  [SIM:{symbol}] Order placed: clientOrderId={data.get('clientOrderId')} "
-             f"status={data.get('orderStatus')}")
+    log.info("  [SIM:%s] Order placed: clientOrderId=%s status=%s",
+             symbol, data.get('clientOrderId'), data.get('orderStatus'))
     return data
 
 
@@ -617,7 +1216,7 @@ def sim_place_order_with_stepdown(symbol, initial_quantity, limit_price, label="
 def _is_rth_now():
     """Return True if current ET time is in regular trading hours (9:30-16:00)."""
     from datetime import datetime as _dt, time as _t
-    now_et = _dt.now(ZoneInfo("America/New_York")).time()
+    now_et = _dt.now(ET_TZ).time()
     return _t(9, 30) <= now_et < _t(16, 0)
 
 
@@ -644,7 +1243,7 @@ def place_stop_order(account_id, headers_fn, symbol, quantity, trigger_price,
     Returns the order response dict, or None on failure. Failures here are LOGGED
     but do not propagate — losing SL protection should not kill the active trade.
     """
-    client_id = f"SL_{uuid.uuid4().hex[:8].upper()}"
+    client_id = f"SL_{_next_order_suffix()}"
     payload = {
         "clientOrderId": client_id,
         "symbol":        symbol,
@@ -663,11 +1262,16 @@ def place_stop_order(account_id, headers_fn, symbol, quantity, trigger_price,
         payload["timeInForce"] = "Day"         # R135: a plain market Stop is NOT Day+ eligible (RTH only)
 
     url = f"{BASE_URL}/v1/api/accounts/{account_id}/order"
-    log.info(f"  → {label} POST {url}")
-    log.info(f"    body: {json.dumps(payload)}")
+    log.info("  → %s POST %s", label, url)
+    body = orjson.dumps(payload)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("    body: %s", body.decode())
     try:
-        r = requests.post(url, headers=headers_fn(), json=payload, timeout=15)
-        log.info(f"  ← {label} status: {r.status_code}  body: {r.text[:400]}")
+        r = SESSION.post(url, headers=headers_fn(), data=body, timeout=15)
+        _invalidate_account_cache(account_id)
+        log.info("  ← %s status: %s", label, r.status_code)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("    body: %s", r.content[:400].decode("utf-8", "replace"))
         if not r.ok:
             log.error(f"  [{symbol}] Stop order FAILED {r.status_code} — body: {r.text[:300]}")
             return None
@@ -689,10 +1293,13 @@ def cancel_stop_order(account_id, headers_fn, symbol, stop_client_order_id, labe
     if not stop_client_order_id:
         return True  # no stop to cancel
     url = f"{BASE_URL}/v1/api/accounts/{account_id}/orders/{stop_client_order_id}"
-    log.info(f"  → {label} DELETE {url}")
+    log.info("  → %s DELETE %s", label, url)
     try:
-        r = requests.delete(url, headers=headers_fn(), timeout=10)
-        log.info(f"  ← {label} status: {r.status_code}  body: {r.text[:200]}")
+        r = SESSION.delete(url, headers=headers_fn(), timeout=10)
+        _invalidate_account_cache(account_id)
+        log.info("  ← %s status: %s", label, r.status_code)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("    body: %s", r.content[:200].decode("utf-8", "replace"))
         if r.status_code in (200, 204):
             log.info(f"  [{symbol}] Stop order {stop_client_order_id} cancelled")
             return True
@@ -756,7 +1363,7 @@ def verify_stop_alive(account_id, headers_fn, symbol, stop_client_order_id,
     prefix = f"[SIM:{symbol}]" if is_sim else f"[{symbol}]"
     try:
         time.sleep(delay_seconds)
-        r = requests.get(
+        r = SESSION.get(
             f"{BASE_URL}/v1/api/accounts/{account_id}/orders",
             headers=headers_fn(), timeout=10
         )
@@ -810,100 +1417,184 @@ def request_locate_quote(symbol, quantity, quote_req_id):
     return tz_post("/v1/api/accounts/locates/quote", payload, "LOCATE_REQUEST")
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# LOCATE DISPATCHER  (one /locates/history poller for every pending locate)
+# ══════════════════════════════════════════════════════════════════════════════
+# Each SHORT used to poll the full history on its own, so N symbols locating
+# at once cost N history GETs per interval. Now locate threads register their
+# quoteReqID and sleep on an Event; this single thread reads the history once
+# per interval and hands each waiter its PRIMARY / .SU rows. The waiter still
+# makes the decision (_pick_locate). Poll interval backs off from
+# LOCATE_POLL_INTERVAL to LOCATE_POLL_MAX_WAIT and snaps back to the tight end
+# whenever a new locate registers. The history body is ijson-streamed and
+# parsing stops once every waiter has both its PRIMARY and .SU row.
+LOCATE_OFFERED     = 65                             # locateStatus: priced, ready to accept
+_LOCATE_TERMINAL   = frozenset({56, 67, 52})         # Rejected / Expired / Canceled
+_LOCATE_TYPE_LABEL = MappingProxyType({1: "Locate", 2: "Locate", 3: "PreBorrow", 4: "SingleUse"})
+
+_locate_waiters      = {}   # quote_req_id → {"symbol", "event", "primary", "su"}
+_locate_waiters_lock = threading.Lock()
+_locate_wakeup       = threading.Event()
+
+
+def _locate_dispatcher_thread():
+    delay = LOCATE_POLL_INTERVAL
+    while True:
+        with _locate_waiters_lock:
+            pending = len(_locate_waiters)
+        if not pending:
+            _locate_wakeup.wait(60)
+            _locate_wakeup.clear()
+            delay = LOCATE_POLL_INTERVAL
+            continue
+        try:
+            with _locate_waiters_lock:
+                wanted = set(_locate_waiters)
+            url = f"{BASE_URL}/v1/api/accounts/{ACCOUNT_ID}/locates/history"
+            log.info("  → LOCATE_POLL GET %s (%s pending)", url, pending)
+            with SESSION.get(url, headers=TZ_HEADERS, timeout=15, stream=True) as r:
+                log.info("  ← status: %s", r.status_code)
+                if r.status_code == 200:
+                    r.raw.decode_content = True
+                    found   = {}        # quote_req_id → {"primary": row, "su": row}
+                    missing = 2 * len(wanted)
+                    parsed  = 0
+                    for item in ijson.items(r.raw, "locateHistory.item", use_float=True):
+                        parsed += 1
+                        qid   = item.get("quoteReqID") or ""
+                        is_su = qid.endswith(".SU")
+                        base  = qid[:-3] if is_su else qid
+                        if base not in wanted:
+                            continue
+                        rows = found.setdefault(base, {})
+                        side = "su" if is_su else "primary"
+                        if side not in rows:
+                            missing -= 1
+                        rows[side] = item
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("    match: %s", orjson.dumps(item).decode())
+                        if not missing:
+                            r.raw.drain_conn()      # skip parsing the rest, keep the socket
+                            break
+                    with _locate_waiters_lock:
+                        for qid, rows in found.items():
+                            w = _locate_waiters.get(qid)
+                            if w is not None:
+                                w.update(rows)
+                                w["event"].set()
+                    log.info("  LOCATE_POLL: %s history entries parsed%s — %s/%s pending request(s) seen",
+                             parsed, " (stopped early)" if not missing else "", len(found), pending)
+                else:
+                    log.warning("  Locate poll failed: %s", r.status_code)
+        except Exception as e:
+            log.error("  Locate dispatcher error: %s", e)
+        if _locate_wakeup.wait(min(delay, LOCATE_POLL_MAX_WAIT)):
+            _locate_wakeup.clear()
+            delay = LOCATE_POLL_INTERVAL
+        else:
+            delay *= LOCATE_POLL_BACKOFF
+
+
+threading.Thread(target=_locate_dispatcher_thread, daemon=True).start()
+
+
+def _pick_locate(symbol, primary_item, su_item):
+    """Decide on the PRIMARY / .SU locate rows seen so far for one request.
+    Returns the row to act on (offered, or terminally rejected), or None to
+    keep waiting.
+    """
+    for label, item in (("PRIMARY", primary_item), ("SU", su_item)):
+        if item:
+            log.info("  [%s] %s (%s): status=%s | shares=%s | price=$%s | "
+                     "type=%s | error=%s | text=%s",
+                     symbol, label, item.get("quoteReqID"), item.get("locateStatus"),
+                     item.get("locateShares"), item.get("locatePrice"),
+                     item.get("locateType"), item.get("locateError"), item.get("text", ""))
+
+    # Decision logic — pick the cheapest available offer.
+    #
+    # For Reg SHO threshold symbols, TZ returns two parallel rows:
+    #   - primary quoteReqID → PreBorrow side (locateType=3, reusable, pricier)
+    #   - <quoteReqID>.SU    → SingleUse side (locateType=4, one-shot, cheaper)
+    # Per TZ docs: SU is typically 3-5x cheaper. Default is to prefer SU
+    # unless we need PB's reusable-through-day behavior. For one-direction
+    # short strategies (this code's use case), SU is always preferred.
+    #
+    # Non-threshold names get only one row (standard Locate, type 1 or 2),
+    # in which case SU sibling won't exist and we return the primary.
+    primary_offered = (primary_item is not None
+                       and primary_item.get("locateStatus") == LOCATE_OFFERED)
+    su_offered      = (su_item is not None
+                       and su_item.get("locateStatus") == LOCATE_OFFERED)
+
+    if primary_offered and su_offered:
+        # Both pools priced — pick cheaper (typically SU)
+        primary_price = float(primary_item.get("locatePrice", 0))
+        su_price      = float(su_item.get("locatePrice", 0))
+        if su_price > 0 and (primary_price == 0 or su_price <= primary_price):
+            log.info("  [%s] Both pools offered — choosing SU @ $%s/sh "
+                     "(vs PB @ $%s/sh, saving $%.4f/sh, %.0f%%)",
+                     symbol, su_price, primary_price, primary_price - su_price,
+                     ((primary_price - su_price) / primary_price * 100) if primary_price else 0)
+            return su_item
+        else:
+            log.info("  [%s] Both pools offered — choosing PB @ $%s/sh (SU @ $%s/sh not cheaper)",
+                     symbol, primary_price, su_price)
+            return primary_item
+
+    if primary_offered:
+        # Only primary is offered (non-threshold name, or SU still pending/never appeared)
+        return primary_item
+
+    if su_offered:
+        # SU offered but primary is not yet at 65 — could be Pending or Rejected
+        # Per docs: for threshold names where only SU has inventory, primary
+        # stays at status 54 (Pending) or transitions to 56 (Rejected with err 11).
+        # Either way, SU is our only choice and we should take it.
+        primary_status = primary_item.get("locateStatus") if primary_item else None
+        log.info("  [%s] Only SU offered (primary status=%s) — using SU @ $%s/sh",
+                 symbol, primary_status, su_item.get("locatePrice"))
+        return su_item
+
+    # No offered row yet — check for terminal rejections on primary
+    if primary_item and primary_item.get("locateStatus") in _LOCATE_TERMINAL:
+        # Primary terminally rejected and no SU offer — give up
+        if su_item and su_item.get("locateStatus") in _LOCATE_TERMINAL:
+            log.info("  [%s] Both pools terminally rejected — giving up", symbol)
+        return primary_item
+
+    return None
+
+
 def poll_locate_status(symbol, quote_req_id):
     """
-    Poll locate history every LOCATE_POLL_INTERVAL seconds.
+    Wait (via the locate dispatcher) for quote_req_id to become actionable.
     Returns locate dict on actionable status, None on timeout.
     Status 65=Offered, 56=Rejected, 67=Expired, 52=Canceled
     """
-    su_id = f"{quote_req_id}.SU"
+    su_id  = f"{quote_req_id}.SU"
+    waiter = {"symbol": symbol, "event": threading.Event(), "primary": None, "su": None}
+    with _locate_waiters_lock:
+        _locate_waiters[quote_req_id] = waiter
+    _locate_wakeup.set()
+    log.info("  [%s] Waiting on locate dispatcher for %s or %s", symbol, quote_req_id, su_id)
     deadline = time.time() + LOCATE_POLL_TIMEOUT
-    while time.time() < deadline:
-        url = f"{BASE_URL}/v1/api/accounts/{ACCOUNT_ID}/locates/history"
-        log.info(f"  → LOCATE_POLL GET {url}")
-        r = requests.get(url, headers=tz_headers(), timeout=15)
-        log.info(f"  ← status: {r.status_code}  body: {r.text}")
-        if r.status_code == 200:
-            history = r.json().get("locateHistory", [])
-            log.info(f"  [{symbol}] {len(history)} history entries — "
-                     f"searching for {quote_req_id} or {su_id}")
-
-            primary_item = None
-            su_item      = None
-            for item in history:
-                qid = item.get("quoteReqID")
-                if qid == quote_req_id:
-                    primary_item = item
-                elif qid == su_id:
-                    su_item = item
-
-            for label, item in (("PRIMARY", primary_item), ("SU", su_item)):
-                if item:
-                    log.info(f"  [{symbol}] {label} ({item.get('quoteReqID')}): "
-                             f"status={item.get('locateStatus')} | "
-                             f"shares={item.get('locateShares')} | "
-                             f"price=${item.get('locatePrice')} | "
-                             f"type={item.get('locateType')} | "
-                             f"error={item.get('locateError')} | "
-                             f"text={item.get('text', '')}")
-
-            # Decision logic — pick the cheapest available offer.
-            #
-            # For Reg SHO threshold symbols, TZ returns two parallel rows:
-            #   - primary quoteReqID → PreBorrow side (locateType=3, reusable, pricier)
-            #   - <quoteReqID>.SU    → SingleUse side (locateType=4, one-shot, cheaper)
-            # Per TZ docs: SU is typically 3-5x cheaper. Default is to prefer SU
-            # unless we need PB's reusable-through-day behavior. For one-direction
-            # short strategies (this code's use case), SU is always preferred.
-            #
-            # Non-threshold names get only one row (standard Locate, type 1 or 2),
-            # in which case SU sibling won't exist and we return the primary.
-            primary_offered = (primary_item is not None
-                               and primary_item.get("locateStatus") == 65)
-            su_offered      = (su_item is not None
-                               and su_item.get("locateStatus") == 65)
-
-            if primary_offered and su_offered:
-                # Both pools priced — pick cheaper (typically SU)
-                primary_price = float(primary_item.get("locatePrice", 0))
-                su_price      = float(su_item.get("locatePrice", 0))
-                if su_price > 0 and (primary_price == 0 or su_price <= primary_price):
-                    log.info(f"  [{symbol}] Both pools offered — choosing SU "
-                             f"@ ${su_price}/sh (vs PB @ ${primary_price}/sh, "
-                             f"saving ${primary_price - su_price:.4f}/sh, "
-                             f"{((primary_price - su_price) / primary_price * 100) if primary_price else 0:.0f}%)")
-                    return su_item
-                else:
-                    log.info(f"  [{symbol}] Both pools offered — choosing PB "
-                             f"@ ${primary_price}/sh (SU @ ${su_price}/sh not cheaper)")
-                    return primary_item
-
-            if primary_offered:
-                # Only primary is offered (non-threshold name, or SU still pending/never appeared)
-                return primary_item
-
-            if su_offered:
-                # SU offered but primary is not yet at 65 — could be Pending or Rejected
-                # Per docs: for threshold names where only SU has inventory, primary
-                # stays at status 54 (Pending) or transitions to 56 (Rejected with err 11).
-                # Either way, SU is our only choice and we should take it.
-                primary_status = primary_item.get("locateStatus") if primary_item else None
-                log.info(f"  [{symbol}] Only SU offered (primary status={primary_status}) — "
-                         f"using SU @ ${su_item.get('locatePrice')}/sh")
-                return su_item
-
-            # No offered row yet — check for terminal rejections on primary
-            if primary_item and primary_item.get("locateStatus") in (56, 67, 52):
-                # Primary terminally rejected and no SU offer — give up
-                if su_item and su_item.get("locateStatus") in (56, 67, 52):
-                    log.info(f"  [{symbol}] Both pools terminally rejected — giving up")
-                return primary_item
-
-            log.info(f"  [{symbol}] {quote_req_id} not yet actionable — polling again")
-        else:
-            log.warning(f"  [{symbol}] Locate poll failed: {r.status_code}")
-        time.sleep(LOCATE_POLL_INTERVAL)
-    log.warning(f"  [{symbol}] Locate poll timed out after {LOCATE_POLL_TIMEOUT}s")
+    try:
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0 or not waiter["event"].wait(remaining):
+                break
+            waiter["event"].clear()
+            with _locate_waiters_lock:
+                primary_item, su_item = waiter["primary"], waiter["su"]
+            locate = _pick_locate(symbol, primary_item, su_item)
+            if locate is not None:
+                return locate
+            log.info("  [%s] %s not yet actionable — polling again", symbol, quote_req_id)
+    finally:
+        with _locate_waiters_lock:
+            _locate_waiters.pop(quote_req_id, None)
+    log.warning("  [%s] Locate poll timed out after %ss", symbol, LOCATE_POLL_TIMEOUT)
     return None
 
 
@@ -1061,17 +1752,9 @@ def _get_twelvedata_price(symbol):
 
 
 def _get_yahoo_price(symbol):
-    import urllib.request as _req, datetime as _dt, json as _json
-
-    utc_now   = _dt.datetime.now(_dt.timezone.utc)
-    year      = utc_now.year
-    dst_start = _dt.datetime(year, 3, 1) + _dt.timedelta(
-        days=(6 - _dt.datetime(year, 3, 1).weekday()) % 7 + 7)
-    dst_end   = _dt.datetime(year, 11, 1) + _dt.timedelta(
-        days=(6 - _dt.datetime(year, 11, 1).weekday()) % 7)
-    is_dst    = dst_start <= utc_now.replace(tzinfo=None) < dst_end
-    offset    = -4 if is_dst else -5
-    et_now    = utc_now + _dt.timedelta(hours=offset)
+    import urllib.request as _req, datetime as _dt
+
+    et_now    = _dt.datetime.now(ET_TZ)
     et_time   = et_now.hour * 60 + et_now.minute
     rth_open  = 9 * 60 + 30
     rth_close = 16 * 60
@@ -1087,7 +1770,7 @@ def _get_yahoo_price(symbol):
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         })
         with _req.urlopen(req, timeout=5) as resp:
-            raw   = _json.loads(resp.read())
+            raw   = orjson.loads(resp.read())
         result    = raw["chart"]["result"][0]
         meta      = result["meta"]
         closes    = result["indicators"]["quote"][0].get("close", [])
@@ -1097,7 +1780,7 @@ def _get_yahoo_price(symbol):
             price = meta.get("regularMarketPrice")
             label = "yahoo_v8(regular)" if price else None
         else:
-            now_ts     = utc_now.timestamp()
+            now_ts     = et_now.timestamp()
             lookback_s = 4 * 3600 if is_ah else 13 * 3600
             price  = None
             label  = None
@@ -1211,7 +1894,7 @@ def locate_and_short(symbol, qc_quantity, entry_price):
     HIGH_RISK_BUFFER = 1.25
 
     from datetime import datetime as _datetime, time as _time
-    now_et = _datetime.now(ZoneInfo("America/New_York"))
+    now_et = _datetime.now(ET_TZ)
     et_time = now_et.time()
     rth_open  = _time(4,  0)
     rth_close = _time(16, 0)
@@ -1345,7 +2028,7 @@ def locate_and_short(symbol, qc_quantity, entry_price):
     locate       = None
     quote_req_id = None
     for attempt, attempt_qty in enumerate(ladder, 1):
-        if get_state(symbol).get("state") != "LOCATING":
+        if not cas_state(symbol, "LOCATING", "LOCATING"):
             log.warning(f"[{symbol}] State changed during locate stepdown — aborting")
             return
 
@@ -1372,7 +2055,7 @@ def locate_and_short(symbol, qc_quantity, entry_price):
         log.info(f"[{symbol}] Step 5: Polling locate status (max {LOCATE_POLL_TIMEOUT}s)")
         locate = poll_locate_status(symbol, quote_req_id)
 
-        if get_state(symbol).get("state") != "LOCATING":
+        if not cas_state(symbol, "LOCATING", "LOCATING"):
             log.warning(f"[{symbol}] State changed during locate poll — aborting")
             return
 
@@ -1511,7 +2194,7 @@ def locate_and_short(symbol, qc_quantity, entry_price):
         block(symbol, f"locate inventory not confirmed after 15s — R43 risk too high, aborting")
         return
 
-    if get_state(symbol).get("state") != "LOCATING":
+    if not cas_state(symbol, "LOCATING", "LOCATING"):
         log.warning(f"[{symbol}] State changed after accept — aborting order")
         return
 
@@ -1522,14 +2205,23 @@ def locate_and_short(symbol, qc_quantity, entry_price):
     try:
         result = place_order_with_stepdown(symbol, final_quantity, limit_price, "SHORT_ORDER")
         placed_qty = result.get("orderQuantity", final_quantity)
-        set_state(
-            symbol,
-            state="ACTIVE",
+        if not cas_state(
+            symbol, "LOCATING", "ACTIVE",
             entry_price=entry_price,
             quantity=placed_qty,
             client_order_id=result.get("clientOrderId"),
             locate_cost_per_share=locate_price,
-        )
+        ):
+            # A COVER / reset / block landed while the order was in flight.
+            # Pull the order, and cover whatever already filled (or block with
+            # MANUAL ACTION) — a bare cancel would leave a part-fill unmanaged.
+            # If the COVER's own cleanup is already running it owns the
+            # symbol, and only this order is cancelled.
+            log.warning(f"[{symbol}] State changed while placing short "
+                        f"({result.get('clientOrderId')}) — running cancel+cleanup")
+            cancel_and_cleanup(symbol, "state changed while short order was in flight",
+                               result.get("clientOrderId"))
+            return
         log_locate(symbol=symbol, entry_price=entry_price,
                    shares_offered=placed_qty,
                    locate_cost_per_share=locate_price,
@@ -1608,7 +2300,7 @@ def locate_and_short_sim(symbol, qc_quantity, entry_price):
     usable_capital = min(available_cash, margin_available)
 
     from datetime import datetime as _datetime, time as _time
-    now_et = _datetime.now(ZoneInfo("America/New_York"))
+    now_et = _datetime.now(ET_TZ)
     et_time = now_et.time()
     in_premarket_or_rth = _time(4, 0)  <= et_time < _time(16, 0)
     in_ah               = _time(16, 0) <= et_time < _time(20, 0)
@@ -1790,7 +2482,7 @@ def locate_and_short_sim(symbol, qc_quantity, entry_price):
                     log.warning(f"[SIM:{symbol}] Phantom locate expired/cancelled — "
                                 f"proceeding without cost data")
     
-                elif locate.get("locateStatus") == 65:
+                elif locate.get("locateStatus") == LOCATE_OFFERED:
                     # Offered — record cost per share, extrapolate to sim quantity, DO NOT accept
                     locate_cost_per_share = float(locate.get("locatePrice", 0))
                     offered_qty           = int(locate.get("locateShares", 0))
@@ -1804,7 +2496,7 @@ def locate_and_short_sim(symbol, qc_quantity, entry_price):
                     locate_check_ok       = True
     
                     # Human-readable type label for log output
-                    type_label = {1: "Locate", 2: "Locate", 3: "PreBorrow", 4: "SingleUse"}.get(
+                    type_label = _LOCATE_TYPE_LABEL.get(
                         locate_type_code, f"unknown({locate_type_code})")
                     log.info(
                         f"\n[SIM:{symbol}] ╔══ PHANTOM LOCATE RESULT ═════════════════════╗\n"
@@ -1850,7 +2542,7 @@ def locate_and_short_sim(symbol, qc_quantity, entry_price):
         log.info(f"[SIM:{symbol}] Locate check inconclusive — proceeding with sim order "
                  f"(phantom cost logged as $0.00)")
 
-    if sim_get_state(symbol).get("state") != "LOCATING":
+    if not sim_cas_state(symbol, "LOCATING", "LOCATING"):
         log.warning(f"[SIM:{symbol}] State changed during phantom locate — aborting")
         return
 
@@ -1862,15 +2554,19 @@ def locate_and_short_sim(symbol, qc_quantity, entry_price):
     try:
         result     = sim_place_order_with_stepdown(symbol, final_quantity, limit_price)
         placed_qty = result.get("orderQuantity", final_quantity)
-        sim_set_state(
-            symbol,
-            state="ACTIVE",
+        if not sim_cas_state(
+            symbol, "LOCATING", "ACTIVE",
             entry_price=entry_price,
             quantity=placed_qty,
             client_order_id=result.get("clientOrderId"),
             phantom_locate_cost=total_phantom_cost,
             phantom_locate_cost_per_share=locate_cost_per_share,
-        )
+        ):
+            log.warning(f"[SIM:{symbol}] State changed while placing short "
+                        f"({result.get('clientOrderId')}) — running cancel+cleanup")
+            sim_cancel_and_cleanup(symbol, "state changed while short order was in flight",
+                                   result.get("clientOrderId"))
+            return
         log_locate(symbol=symbol, entry_price=entry_price,
                    shares_offered=placed_qty,
                    locate_cost_per_share=locate_cost_per_share,
@@ -1918,14 +2614,14 @@ def monitor_short_fill(symbol, client_order_id, timeout_minutes):
     while _time.time() < deadline:
         _time.sleep(poll_interval)
 
-        state = get_state(symbol).get("state")
+        state = get_state(symbol).state
         if state != "ACTIVE":
             if state == "BLOCKED":
                 log.warning(f"[{symbol}] SHORT MONITOR: state=BLOCKED — cancelling orphaned order {client_order_id}")
                 try:
                     cancelled = cancel_all_open_orders(symbol)
                     log.info(f"[{symbol}] SHORT MONITOR: cancelled {cancelled} open order(s) after BLOCKED state")
-                    position = get_position(symbol)
+                    position = get_position(symbol, fresh=True)
                     if position and float(position.get("shares", 0)) < 0:
                         log.warning(f"[{symbol}] SHORT MONITOR: order filled BEFORE cancel — short position exists! "
                                     f"Manual action required or wait for COVER webhook.")
@@ -1936,7 +2632,7 @@ def monitor_short_fill(symbol, client_order_id, timeout_minutes):
             return
 
         try:
-            r = tz_get(f"/v1/api/accounts/{ACCOUNT_ID}/orders", "SHORT_MONITOR_ORDERS")
+            r = tz_get(ORDERS_PATH, "SHORT_MONITOR_ORDERS")
             orders = r.json() if r.ok else []
             if not isinstance(orders, list):
                 orders = orders.get("orders", [])
@@ -1984,7 +2680,7 @@ def monitor_short_fill(symbol, client_order_id, timeout_minutes):
                     final_executed = executed
                     final_entry_fill = float(order.get("priceAvg") or order.get("lastPrice") or 0)
                     try:
-                        r2 = tz_get(f"/v1/api/accounts/{ACCOUNT_ID}/orders", "SHORT_FINAL_READ")
+                        r2 = tz_get(ORDERS_PATH, "SHORT_FINAL_READ")
                         orders2 = r2.json() if r2.ok else []
                         if not isinstance(orders2, list):
                             orders2 = orders2.get("orders", [])
@@ -2013,8 +2709,8 @@ def monitor_short_fill(symbol, client_order_id, timeout_minutes):
 
                 if "R35" in reject_text or "Buying Power" in reject_text:
                     s = get_state(symbol)
-                    prev_qty  = int(s.get("quantity", 0))
-                    lp        = float(s.get("entry_price", 0))
+                    prev_qty  = int(s.quantity)
+                    lp        = float(s.entry_price)
                     if prev_qty > 0 and lp > 0:
                         next_qty = max(1, int(prev_qty * 0.8))
                         log.warning(f"[{symbol}] R35 — stepping down from {prev_qty}sh to {next_qty}sh")
@@ -2070,7 +2766,7 @@ def _arm_real_stop_after_fill(symbol, filled_qty, entry_fill, source="full fill"
         return
 
     s = get_state(symbol)
-    sl_pct = float(s.get("sl_pct") or DEFAULT_SL_PCT)
+    sl_pct = float(s.sl_pct or DEFAULT_SL_PCT)
     if sl_pct <= 0:
         log.info(f"[{symbol}] sl_pct={sl_pct} — skipping broker SL")
         return
@@ -2100,13 +2796,13 @@ def monitor_cover_fill(symbol, client_order_id, timeout_minutes):
     while _time.time() < deadline:
         _time.sleep(poll_interval)
 
-        state = get_state(symbol).get("state")
+        state = get_state(symbol).state
         if state == "FLAT":
             log.info(f"[{symbol}] COVER MONITOR: already FLAT — done")
             return
 
         try:
-            r = tz_get(f"/v1/api/accounts/{ACCOUNT_ID}/orders", "COVER_MONITOR_ORDERS")
+            r = tz_get(ORDERS_PATH, "COVER_MONITOR_ORDERS")
             orders = r.json() if r.ok else []
             if not isinstance(orders, list):
                 orders = orders.get("orders", [])
@@ -2119,9 +2815,9 @@ def monitor_cover_fill(symbol, client_order_id, timeout_minutes):
                     cover_fill = float(order.get("priceAvg") or order.get("lastPrice") or 0)
                     order_fee  = float(order.get("orderFee") or 0)
                     s = get_state(symbol)
-                    entry_fill = float(s.get("entry_fill_price") or s.get("entry_price") or 0)
-                    placed_qty = int(s.get("quantity") or executed or 0)
-                    locate_cps = float(s.get("locate_cost_per_share") or 0)
+                    entry_fill = float(s.entry_fill_price or s.entry_price or 0)
+                    placed_qty = int(s.quantity or executed or 0)
+                    locate_cps = float(s.locate_cost_per_share or 0)
                     pnl_pct = None
                     if entry_fill > 0 and cover_fill > 0 and placed_qty > 0:
                         gross = (entry_fill - cover_fill) * placed_qty
@@ -2155,7 +2851,7 @@ def monitor_cover_fill(symbol, client_order_id, timeout_minutes):
     cancel_all_open_orders(symbol)  # this also cancels any armed SL stop
     set_state(symbol, sl_client_order_id=None)
 
-    position = get_position(symbol)
+    position = get_position(symbol, fresh=True)
     if not position or float(position.get("shares", 0)) >= 0:
         log.info(f"[{symbol}] COVER MONITOR: no short position remaining — marking FLAT")
         set_state(symbol, state="FLAT", reason="cover monitor: no position found on retry")
@@ -2186,14 +2882,38 @@ def monitor_cover_fill(symbol, client_order_id, timeout_minutes):
         block(symbol, "aggressive cover failed — MANUAL ACTION REQUIRED")
 
 
-def cancel_and_cleanup(symbol, reason):
+def cancel_and_cleanup(symbol, reason, order_id=None):
+    """Cancel symbol's open orders, buy back any short, then BLOCK it.
+
+    Only one cleanup runs per symbol: the sweep, the position read and the
+    cover are one unit, or two overlapping cleanups (a COVER during LOCATING
+    and the locate thread losing its CAS) would both see the short and buy it
+    back twice. `order_id` is the caller's own just-placed order — if another
+    cleanup holds the symbol, only that order is cancelled; if the symbol was
+    manually reset meanwhile, it is left FLAT rather than blocked.
+    """
+    lk = _cleanup_lock_for(ACCOUNT_ID, symbol)
+    if not lk.acquire(blocking=False):
+        if order_id:
+            log.info("[%s] CANCEL+CLEANUP already running — cancelling only %s", symbol, order_id)
+            cancel_order(order_id)
+        else:
+            log.info("[%s] CANCEL+CLEANUP already running — skipping (%s)", symbol, reason)
+        return
+    try:
+        _cancel_and_cleanup(symbol, reason, order_id)
+    finally:
+        lk.release()
+
+
+def _cancel_and_cleanup(symbol, reason, order_id):
     log.info(f"[{symbol}] CANCEL+CLEANUP: {reason}")
 
     cancelled = cancel_all_open_orders(symbol)  # this also cancels any armed SL stop
     log.info(f"[{symbol}] Cancelled {cancelled} open order(s)")
     set_state(symbol, sl_client_order_id=None)
 
-    position = get_position(symbol)
+    position = get_position(symbol, fresh=True)
     if position:
         shares = float(position.get("shares", 0))
         if shares < 0:
@@ -2224,9 +2944,83 @@ def cancel_and_cleanup(symbol, reason):
     else:
         log.info(f"[{symbol}] No position found — nothing to cover")
 
+    if order_id and get_state(symbol).state == "FLAT":
+        log.info("[%s] Symbol was reset while %s was in flight — leaving it FLAT", symbol, order_id)
+        return
     block(symbol, reason)
 
 
+def execute_cover(symbol, price):
+    """Real COVER work, run on EXECUTOR once /webhook has won the cover claim.
+
+    State is re-read here, not taken from the webhook: the job may sit in the
+    EXECUTOR queue while the fill monitor arms a stop, and that stop must be
+    cancelled before the buy. Returns the result dict that /status/<job_id>
+    reports. On failure the COVERING claim is released back to ACTIVE so a
+    retried COVER can proceed, and the exception is re-raised so the job
+    reports "failed".
+    """
+    s = get_state(symbol)
+    log.info("[%s] COVER: looking up actual position size from TZ", symbol)
+    try:
+        position = get_position(symbol, fresh=True)
+    except Exception as e:
+        log.error("[%s] COVER position lookup failed: %s", symbol, e)
+        set_state(symbol, state="ACTIVE", reason="cover lookup failed")  # un-claim
+        raise
+
+    if position is None:
+        log.warning("[%s] COVER: no TZ position found — entry may not have filled", symbol)
+        block(symbol, "COVER received but no TZ position found")
+        return {"status": "ok", "note": "no position found — blocked"}
+
+    shares = float(position.get("shares", 0))
+    if shares >= 0:
+        log.warning("[%s] COVER: position shares=%s — not a short | blocking", symbol, shares)
+        block(symbol, f"COVER received but position is not short (shares={shares})")
+        return {"status": "ok", "note": "not a short position"}
+
+    cover_qty   = abs(int(shares))
+    cover_limit = float(price)
+
+    log.info("[%s] Covering %s shares | qc_price=$%s | limit=$%s (QC pre-buffered)",
+             symbol, cover_qty, price, cover_limit)
+
+    # Cancel any armed broker SL stop before placing the cover.
+    # The stop is on the same short position; if it remained active, the
+    # cover would attempt to flatten and the stop would still try to fire
+    # on adverse moves, potentially producing a second buy order.
+    stop_id = s.sl_client_order_id
+    if stop_id:
+        cancel_real_stop(symbol, stop_id)
+        set_state(symbol, sl_client_order_id=None)
+
+    try:
+        result = place_order("Buy", symbol, cover_qty, cover_limit, "COVER_ORDER")
+        set_state(symbol, state="FLAT", reason="covered", owner=None)
+        log.info("[%s] COVER PLACED | qty=%s | limit=$%s | clientOrderId=%s | status=%s",
+                 symbol, cover_qty, cover_limit,
+                 result.get("clientOrderId"), result.get("orderStatus"))
+        threading.Thread(
+            target=monitor_cover_fill,
+            args=(symbol, result.get("clientOrderId"), COVER_FILL_TIMEOUT),
+            daemon=True
+        ).start()
+        return {
+            "status":        "ok",
+            "action":        "COVER",
+            "symbol":        symbol,
+            "quantity":      cover_qty,
+            "limit_price":   cover_limit,
+            "clientOrderId": result.get("clientOrderId"),
+            "orderStatus":   result.get("orderStatus"),
+        }
+    except Exception as e:
+        log.error("[%s] Cover order failed: %s", symbol, e)
+        set_state(symbol, state="ACTIVE", reason="cover failed")  # un-claim so a retry can proceed
+        raise
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # SIM ACCOUNT — MONITOR + CLEANUP FUNCTIONS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -2243,7 +3037,7 @@ def sim_monitor_short_fill(symbol, client_order_id, timeout_minutes):
     while time.time() < deadline:
         time.sleep(poll_interval)
 
-        state = sim_get_state(symbol).get("state")
+        state = sim_get_state(symbol).state
         if state != "ACTIVE":
             if state == "BLOCKED":
                 log.warning(f"[SIM:{symbol}] MONITOR: BLOCKED — cancelling orphaned sim order")
@@ -2256,7 +3050,7 @@ def sim_monitor_short_fill(symbol, client_order_id, timeout_minutes):
             return
 
         try:
-            r = sim_tz_get(f"/v1/api/accounts/{SIM_ACCOUNT_ID}/orders", "SIM_MONITOR_ORDERS")
+            r = sim_tz_get(SIM_ORDERS_PATH, "SIM_MONITOR_ORDERS")
             orders = r.json() if r.ok else []
             if not isinstance(orders, list):
                 orders = orders.get("orders", [])
@@ -2301,7 +3095,7 @@ def sim_monitor_short_fill(symbol, client_order_id, timeout_minutes):
                     final_executed = executed
                     final_entry_fill = float(order.get("priceAvg") or order.get("lastPrice") or 0)
                     try:
-                        r2 = sim_tz_get(f"/v1/api/accounts/{SIM_ACCOUNT_ID}/orders", "SIM_SHORT_FINAL_READ")
+                        r2 = sim_tz_get(SIM_ORDERS_PATH, "SIM_SHORT_FINAL_READ")
                         orders2 = r2.json() if r2.ok else []
                         if not isinstance(orders2, list):
                             orders2 = orders2.get("orders", [])
@@ -2360,7 +3154,7 @@ def _arm_sim_stop_after_fill(symbol, filled_qty, entry_fill, source="full fill")
         return
 
     s = sim_get_state(symbol)
-    sl_pct = float(s.get("sl_pct") or DEFAULT_SL_PCT)
+    sl_pct = float(s.sl_pct or DEFAULT_SL_PCT)
     if sl_pct <= 0:
         log.info(f"[SIM:{symbol}] sl_pct={sl_pct} — skipping broker SL")
         return
@@ -2390,12 +3184,12 @@ def sim_monitor_cover_fill(symbol, client_order_id, timeout_minutes):
     while time.time() < deadline:
         time.sleep(poll_interval)
 
-        if sim_get_state(symbol).get("state") == "FLAT":
+        if sim_get_state(symbol).state == "FLAT":
             log.info(f"[SIM:{symbol}] COVER MONITOR: already FLAT — done")
             return
 
         try:
-            r = sim_tz_get(f"/v1/api/accounts/{SIM_ACCOUNT_ID}/orders", "SIM_COVER_MONITOR")
+            r = sim_tz_get(SIM_ORDERS_PATH, "SIM_COVER_MONITOR")
             orders = r.json() if r.ok else []
             if not isinstance(orders, list):
                 orders = orders.get("orders", [])
@@ -2410,10 +3204,10 @@ def sim_monitor_cover_fill(symbol, client_order_id, timeout_minutes):
                     cover_fill = float(order.get("priceAvg") or order.get("lastPrice") or 0)
                     order_fee  = float(order.get("orderFee") or 0)
                     s            = sim_get_state(symbol)
-                    phantom_cost = float(s.get("phantom_locate_cost") or 0)
-                    locate_cps   = float(s.get("phantom_locate_cost_per_share") or 0)
-                    entry_fill   = float(s.get("entry_fill_price") or s.get("entry_price") or 0)
-                    placed_qty   = int(s.get("quantity") or executed or 0)
+                    phantom_cost = float(s.phantom_locate_cost or 0)
+                    locate_cps   = float(s.phantom_locate_cost_per_share or 0)
+                    entry_fill   = float(s.entry_fill_price or s.entry_price or 0)
+                    placed_qty   = int(s.quantity or executed or 0)
                     pnl_pct = None
                     if entry_fill > 0 and cover_fill > 0 and placed_qty > 0:
                         gross = (entry_fill - cover_fill) * placed_qty
@@ -2447,7 +3241,7 @@ def sim_monitor_cover_fill(symbol, client_order_id, timeout_minutes):
     sim_cancel_all_open_orders(symbol)  # this also cancels any armed SL stop
     sim_set_state(symbol, sl_client_order_id=None)
 
-    position = sim_get_position(symbol)
+    position = sim_get_position(symbol, fresh=True)
     if not position or float(position.get("shares", 0)) >= 0:
         log.info(f"[SIM:{symbol}] COVER MONITOR: no short remaining — marking FLAT")
         sim_set_state(symbol, state="FLAT", reason="cover monitor: no position on retry")
@@ -2481,14 +3275,30 @@ def sim_monitor_cover_fill(symbol, client_order_id, timeout_minutes):
         sim_block(symbol, "SIM aggressive cover failed — MANUAL ACTION REQUIRED")
 
 
-def sim_cancel_and_cleanup(symbol, reason):
+def sim_cancel_and_cleanup(symbol, reason, order_id=None):
+    """Sim equivalent of cancel_and_cleanup (one cleanup per symbol)."""
+    lk = _cleanup_lock_for(SIM_ACCOUNT_ID, symbol)
+    if not lk.acquire(blocking=False):
+        if order_id:
+            log.info("[SIM:%s] CANCEL+CLEANUP already running — cancelling only %s", symbol, order_id)
+            sim_cancel_order(order_id)
+        else:
+            log.info("[SIM:%s] CANCEL+CLEANUP already running — skipping (%s)", symbol, reason)
+        return
+    try:
+        _sim_cancel_and_cleanup(symbol, reason, order_id)
+    finally:
+        lk.release()
+
+
+def _sim_cancel_and_cleanup(symbol, reason, order_id):
     log.info(f"[SIM:{symbol}] CANCEL+CLEANUP: {reason}")
 
     cancelled = sim_cancel_all_open_orders(symbol)  # this also cancels any armed SL stop
     log.info(f"[SIM:{symbol}] Cancelled {cancelled} open order(s)")
     sim_set_state(symbol, sl_client_order_id=None)
 
-    position = sim_get_position(symbol)
+    position = sim_get_position(symbol, fresh=True)
     if position:
         shares = float(position.get("shares", 0))
         if shares < 0:
@@ -2514,13 +3324,288 @@ def sim_cancel_and_cleanup(symbol, reason):
     else:
         log.info(f"[SIM:{symbol}] No sim position found")
 
+    if order_id and sim_get_state(symbol).state == "FLAT":
+        log.info("[SIM:%s] Symbol was reset while %s was in flight — leaving it FLAT", symbol, order_id)
+        return
     sim_block(symbol, reason)
 
 
+def sim_execute_cover(symbol, price):
+    """Sim equivalent of execute_cover (re-reads state, raises on failure)."""
+    s = sim_get_state(symbol)
+    try:
+        position = sim_get_position(symbol, fresh=True)
+    except Exception as e:
+        log.error("[SIM:%s] COVER position lookup failed: %s", symbol, e)
+        sim_set_state(symbol, state="ACTIVE", reason="cover lookup failed")  # un-claim
+        raise
+
+    if position is None:
+        log.warning("[SIM:%s] COVER: no sim position found", symbol)
+        sim_block(symbol, "COVER received but no sim position found")
+        return {"status": "ok", "note": "no position found — blocked", "mode": "sim"}
+
+    shares = float(position.get("shares", 0))
+    if shares >= 0:
+        log.warning("[SIM:%s] COVER: not a short (shares=%s)", symbol, shares)
+        sim_block(symbol, f"COVER but position is not short (shares={shares})")
+        return {"status": "ok", "note": "not a short position", "mode": "sim"}
+
+    cover_qty    = abs(int(shares))
+    cover_limit  = float(price)
+    phantom_cost = s.phantom_locate_cost
+
+    log.info("[SIM:%s] Covering %ssh | limit=$%s | phantom_locate_cost=$%.2f",
+             symbol, cover_qty, cover_limit, phantom_cost)
+
+    # Cancel armed sim broker SL stop before placing the cover
+    stop_id = s.sl_client_order_id
+    if stop_id:
+        cancel_sim_stop(symbol, stop_id)
+        sim_set_state(symbol, sl_client_order_id=None)
+
+    try:
+        result = sim_place_order("Buy", symbol, cover_qty, cover_limit, "SIM_COVER_ORDER")
+        sim_set_state(symbol, state="FLAT", reason="covered", owner=None)
+        log.info("[SIM:%s] COVER PLACED | qty=%s | limit=$%s | clientOrderId=%s | "
+                 "status=%s | phantom_locate_cost=$%.2f",
+                 symbol, cover_qty, cover_limit, result.get("clientOrderId"),
+                 result.get("orderStatus"), phantom_cost)
+        threading.Thread(
+            target=sim_monitor_cover_fill,
+            args=(symbol, result.get("clientOrderId"), COVER_FILL_TIMEOUT),
+            daemon=True,
+        ).start()
+        return {
+            "status":              "ok",
+            "action":              "COVER",
+            "symbol":              symbol,
+            "mode":                "sim",
+            "quantity":            cover_qty,
+            "limit_price":         cover_limit,
+            "clientOrderId":       result.get("clientOrderId"),
+            "orderStatus":         result.get("orderStatus"),
+            "phantom_locate_cost": round(phantom_cost, 4),
+        }
+    except Exception as e:
+        log.error("[SIM:%s] Cover order failed: %s", symbol, e)
+        sim_set_state(symbol, state="ACTIVE", reason="cover failed")  # un-claim so a retry can proceed
+        raise
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ORDER JOBS  (COVER runs here so the webhook can return 202 immediately)
+# ══════════════════════════════════════════════════════════════════════════════
+# QC's Notify.Web has a short timeout; holding its request open for the TZ
+# position lookup + cover POST risks a QC-side retry. The webhook claims the
+# cover synchronously (double-buy guard), then hands the broker calls to this
+# bounded pool. Futures are kept by job id so /status/<job_id> can report them.
+EXECUTOR       = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tz-order")
+JOB_KEEP_LAST  = 200    # finished jobs older than this many submissions are forgotten
+
+_jobs      = {}         # job_id → Future (insertion-ordered, oldest first)
+_jobs_lock = threading.Lock()
+_JOB_SEQ   = itertools.count(1)     # job ids: order nonce + sequence, like clientOrderId
+
+
+def _run_job(job_id, fn, *args):
+    try:
+        return fn(*args)
+    except Exception as e:
+        log.error("JOB %s: %s raised: %s", job_id, fn.__name__, e)
+        raise
+
+
+def submit_job(fn, *args):
+    """Run fn(*args) on EXECUTOR and return a job id for /status/<job_id>."""
+    job_id = f"{_ORDER_NONCE}{next(_JOB_SEQ):08X}".lower()
+    future = EXECUTOR.submit(_run_job, job_id, fn, *args)
+    with _jobs_lock:
+        _jobs[job_id] = future
+        while len(_jobs) > JOB_KEEP_LAST:
+            del _jobs[next(iter(_jobs))]
+    return job_id
+
+
+# SHORT locates and CANCEL / cover-during-locate cleanups are fire-and-forget
+# (no job id), but still run on bounded pools so a QC burst queues instead of
+# spawning a thread per webhook. Cleanups get their own pool so a cancel storm
+# can never starve new SHORTs of locate workers.
+_locate_pool  = ThreadPoolExecutor(max_workers=16, thread_name_prefix="tz-locate")
+_cleanup_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tz-cleanup")
+
+
+def shutdown_pools():
+    """Stop every worker pool without waiting for it. Queued COVER jobs,
+    locates, cleanups and cancels that have not started are abandoned, as
+    they were with the daemon threads these pools replaced. Called from
+    gunicorn's worker_exit hook and when the local server stops; an atexit
+    hook would be too late, since the interpreter joins pool workers first.
+    """
+    for pool in (EXECUTOR, _locate_pool, _cleanup_pool, _cancel_pool):
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_task(fn, *args):
+    # Pool futures swallow exceptions; log them the way a bare Thread would.
+    try:
+        fn(*args)
+    except Exception:
+        log.exception("%s raised", fn.__name__)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# WEBHOOK PAYLOAD SCHEMA  (compiled once; shared by /webhook + /sim/webhook)
+# ══════════════════════════════════════════════════════════════════════════════
+# Shape check only — field coercion (int/float/upper) stays in the handlers so
+# QC can keep sending 500.0 or "500" for a quantity, and any scalar as the
+# strategy/slot tag; a value that doesn't coerce is a 400 from the handler.
+# Unknown extra keys are allowed.
+WEBHOOK_SCHEMA = {
+    "type": "object",
+    "required": ["action", "symbol"],
+    "properties": {
+        "action":   {"type": "string", "pattern": "(?i)^(short|cover|cancel)$"},
+        "symbol":   {"type": "string"},
+        "quantity": {"type": ["number", "string"], "minimum": 0},
+        "price":    {"type": ["number", "string"], "minimum": 0},
+        "cycle":    {"type": ["number", "string"]},
+        "sl_pct":   {"type": ["number", "string", "null"]},
+        "strategy": {"type": ["string", "number", "boolean", "null"]},
+        "slot":     {"type": ["string", "number", "boolean", "null"]},
+    },
+}
+validate_webhook = fastjsonschema.compile(WEBHOOK_SCHEMA)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# WEBHOOK DEDUP  (QC Notify.Web retries on transport errors)
+# ══════════════════════════════════════════════════════════════════════════════
+# A retried SHORT/COVER that was already accepted gets the original response
+# back (plus "dedup": true) instead of re-entering the state machine — a stale
+# COVER retry after the position closed would otherwise block() the symbol.
+# Keys are namespaced per account by the caller, and only exist when QC sent
+# an explicit cycle: without one every entry would share cycle 1, and a real
+# SHORT → COVER → SHORT inside the window would get the first SHORT's cached
+# response. A None key disables dedup (the burst guard still applies). A
+# completed COVER also drops its cycle's SHORT entry, for the same reason.
+# Bounded LRU: oldest out first.
+DEDUP_WINDOW = 60.0     # seconds an accepted webhook is remembered
+DEDUP_MAX    = 1024
+
+_dedup      = OrderedDict()     # key → (monotonic ts, response dict, http code)
+_dedup_lock = threading.Lock()
+
+
+def dedup_lookup(key, window=DEDUP_WINDOW):
+    """(response, code) for a key accepted within `window` seconds, else None."""
+    if key is None:
+        return None
+    with _dedup_lock:
+        hit = _dedup.get(key)
+    if hit and time.monotonic() - hit[0] < window:
+        return hit[1], hit[2]
+    return None
+
+
+def dedup_remember(key, response, code):
+    if key is None:
+        return
+    with _dedup_lock:
+        _dedup[key] = (time.monotonic(), response, code)
+        _dedup.move_to_end(key)
+        while len(_dedup) > DEDUP_MAX:
+            _dedup.popitem(last=False)
+
+
+def dedup_forget(key):
+    with _dedup_lock:
+        _dedup.pop(key, None)
+
+
+def dedup_track_cover(key, job_id, burst_key, short_key):
+    """Tie a queued COVER's dedup entries to its job. On failure drop `key`
+    and the burst-guard `burst_key`: the cover un-claims back to ACTIVE for a
+    retry, which must not get the cached 202 or be dropped as a repeat. On
+    success drop `short_key`, so the next SHORT is treated as a new entry."""
+    def _done(f):
+        if f.cancelled():       # abandoned by shutdown_pools — process is exiting
+            return
+        if f.exception() is not None:
+            dedup_forget(key)
+            with _recent_lock:
+                _recent.pop(burst_key, None)
+        else:
+            dedup_forget(short_key)
+
+    with _jobs_lock:
+        future = _jobs.get(job_id)
+    if future is not None:
+        future.add_done_callback(_done)
+
+
+# Burst guard: the same (action, symbol, quantity, price) body arriving again
+# within BURST_WINDOW is dropped outright, whatever its cycle and whether or
+# not the first one was accepted yet. Check-and-record is one lock hold, so
+# two identical bodies racing in together can't both pass.
+BURST_WINDOW = 3.0
+
+_recent      = OrderedDict()    # key → monotonic ts, oldest first
+_recent_lock = threading.Lock()
+
+
+def seen_recently(key, window=BURST_WINDOW):
+    """True if `key` was seen within `window` seconds; otherwise record it."""
+    now = time.monotonic()
+    with _recent_lock:
+        while _recent and now - next(iter(_recent.values())) >= window:
+            _recent.popitem(last=False)
+        if key in _recent:
+            return True
+        _recent[key] = now
+        while len(_recent) > DEDUP_MAX:
+            _recent.popitem(last=False)
+    return False
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # FLASK APP
 # ══════════════════════════════════════════════════════════════════════════════
+class OrjsonProvider(JSONProvider):
+    """jsonify()/request.get_json() through orjson. Non-str dict keys are
+    allowed (stdlib json coerces them too); anything orjson can't encode
+    natively falls back to str(), matching Flask's default provider."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Cheap pre-parse gate for the two webhook routes: a QC signal is a ~200 byte
+# JSON object, so anything declaring a big body or a form encoding is a scan /
+# misfire and is refused before the body is read. Content-Type is otherwise
+# not enforced — Notify.Web has sent JSON as text/plain and with no type.
+WEBHOOK_PATHS     = frozenset({"/webhook", "/sim/webhook"})
+WEBHOOK_MAX_BYTES = 4096
+_FORM_MIMETYPES   = frozenset({"application/x-www-form-urlencoded", "multipart/form-data"})
+
+
+@app.before_request
+def _webhook_gate():
+    if request.method != "POST" or request.path not in WEBHOOK_PATHS:
+        return None
+    if (request.content_length or 0) > WEBHOOK_MAX_BYTES:
+        log.warning("  %s rejected: body of %s bytes", request.path, request.content_length)
+        return jsonify({"error": "payload too large"}), 413
+    if request.mimetype in _FORM_MIMETYPES:
+        log.warning("  %s rejected: content-type %s", request.path, request.mimetype)
+        return jsonify({"error": "unsupported content-type"}), 415
+    return None
 
 
 @app.route("/", methods=["GET"])
@@ -2530,7 +3615,7 @@ def root():
 
 _last_health_log = 0
 
-_tz_cache = {"ok": True, "detail": "startup", "routes": "", "account_bp": None}
+_tz_cache = {"ok": True, "auth_ok": True, "detail": "startup", "routes": "", "account_bp": None}
 _tz_cache_lock = threading.Lock()
 _last_tz_check = 0
 
@@ -2540,18 +3625,24 @@ def _refresh_tz_cache():
     while True:
         time.sleep(60)
         try:
-            r = requests.get(f"{BASE_URL}/v1/api/accounts", headers=tz_headers(), timeout=8)
-            ok = r.status_code == 200
-            detail = f"http_{r.status_code}: {r.text[:200]}"
-            r2 = requests.get(f"{BASE_URL}/v1/api/account/{ACCOUNT_ID}", headers=tz_headers(), timeout=8)
+            # HEAD moves no body, and 2s bounds a slow TZ. A 401/403 still
+            # proves the network path is up, but is reported as an auth
+            # failure — the keys are bad and every order would be rejected.
+            r = SESSION.head(f"{BASE_URL}/v1/api/accounts/{ACCOUNT_ID}/positions",
+                             headers=TZ_HEADERS, timeout=2.0, allow_redirects=False)
+            auth_ok = r.status_code not in (401, 403)
+            ok = 200 <= r.status_code < 400 or r.status_code in (401, 403, 405)
+            detail = f"http_{r.status_code}" + ("" if auth_ok else " (auth)")
+            r2 = SESSION.get(f"{BASE_URL}/v1/api/account/{ACCOUNT_ID}", headers=TZ_HEADERS, timeout=8)
             bp = r2.json().get("bp") if r2.ok else None
             try:
-                r3 = requests.get(f"{BASE_URL}/v1/api/accounts/{ACCOUNT_ID}/routes", headers=tz_headers(), timeout=5)
+                r3 = SESSION.get(f"{BASE_URL}/v1/api/accounts/{ACCOUNT_ID}/routes", headers=TZ_HEADERS, timeout=5)
                 routes = r3.text[:300]
             except Exception:
                 routes = _tz_cache.get("routes", "")
             with _tz_cache_lock:
-                _tz_cache.update({"ok": ok, "detail": detail, "routes": routes, "account_bp": bp})
+                _tz_cache.update({"ok": ok, "auth_ok": auth_ok, "detail": detail,
+                                  "routes": routes, "account_bp": bp})
             _last_tz_check = time.time()
         except Exception as e:
             with _tz_cache_lock:
@@ -2561,18 +3652,26 @@ def _refresh_tz_cache():
 threading.Thread(target=_refresh_tz_cache, daemon=True).start()
 
 
-@app.route("/health", methods=["GET", "HEAD"])
-def health():
-    with state_lock:
-        states = {k: v.get("state") for k, v in symbol_state.items()}
-    with sim_state_lock:
-        sim_states = {k: v.get("state") for k, v in sim_symbol_state.items()}
+# /health is polled by Render, the self-watchdog and external monitors; serve
+# the assembled payload from a short-lived cache so bursts of probes build it
+# once. (The TZ reachability part is already refreshed by _refresh_tz_cache.)
+_HEALTH_TTL   = 5.0
+_health_cache = (0.0, None)        # (monotonic ts, payload) — swapped atomically
+_health_cache_lock = threading.Lock()
+
+
+def _build_health_status():
+    states     = _snapshot_states(symbol_state, _lock_for, _STATE_KEY)
+    sim_states = _snapshot_states(sim_symbol_state, _sim_lock_for, _SIM_STATE_KEY)
+    states     = {k: v.state for k, v in states.items()}
+    sim_states = {k: v.state for k, v in sim_states.items()}
     with _tz_cache_lock:
         cache = dict(_tz_cache)
 
     status = {
         "server":            "ok",
-        "tz_api":            "ok" if cache["ok"] else "unreachable",
+        "tz_api":            ("unreachable" if not cache["ok"]
+                              else "ok" if cache["auth_ok"] else "auth_error"),
         "tz_detail":         cache["detail"],
         "account":           ACCOUNT_ID,
         "key_preview":       API_KEY[:8] + "..." if API_KEY else "NOT SET",
@@ -2596,33 +3695,67 @@ def health():
             "price_handling":      "QC pre-buffered — server uses received price directly",
         },
     }
-    global _last_health_log
-    import time as _t
-    now_ts = _t.time()
+    return status
+
+
+@app.route("/health", methods=["GET", "HEAD"])
+def health():
+    global _health_cache, _last_health_log
+    ts, status = _health_cache
+    if status is None or time.monotonic() - ts >= _HEALTH_TTL:
+        with _health_cache_lock:
+            ts, status = _health_cache          # another probe may have just rebuilt it
+            if status is None or time.monotonic() - ts >= _HEALTH_TTL:
+                status = _build_health_status()
+                _health_cache = (time.monotonic(), status)
+
+    now_ts = time.time()
     if now_ts - _last_health_log >= 300:
-        log.info(f"HEALTH: {status}")
+        log.info("HEALTH: %s", status)
         _last_health_log = now_ts
     return jsonify(status), 200
 
 
+# /state and /sim/state get polled in bursts by dashboards; serve the encoded
+# body for 250ms. Snapshot + encode happen outside every lock; two concurrent
+# misses just both rebuild, and the tuple swap keeps readers consistent.
+_STATE_JSON_TTL   = 0.25
+_state_json_cache = {}             # "real"/"sim" → (monotonic ts, JSON str)
+
+
+def _state_json(key, states, lock_for, prefix):
+    hit = _state_json_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _STATE_JSON_TTL:
+        return hit[1]
+    snap = _snapshot_states(states, lock_for, prefix)
+    body = app.json.dumps({k: asdict(v) for k, v in snap.items()})
+    _state_json_cache[key] = (time.monotonic(), body)
+    return body
+
+
 @app.route("/state", methods=["GET"])
 def state_endpoint():
-    with state_lock:
-        return jsonify(dict(symbol_state)), 200
+    body = _state_json("real", symbol_state, _lock_for, _STATE_KEY)
+    return app.response_class(body, mimetype="application/json"), 200
 
 
 @app.route("/sim/state", methods=["GET"])
 def sim_state_endpoint():
-    with sim_state_lock:
-        return jsonify(dict(sim_symbol_state)), 200
+    body = _state_json("sim", sim_symbol_state, _sim_lock_for, _SIM_STATE_KEY)
+    return app.response_class(body, mimetype="application/json"), 200
 
 
 @app.route("/reset/<symbol>", methods=["POST"])
 def reset_symbol(symbol):
     """Emergency manual reset of a real symbol to FLAT."""
     symbol = symbol.upper()
-    with state_lock:
-        symbol_state[symbol] = {"state": "FLAT"}
+    if _redis is not None:
+        _redis_put(_STATE_KEY, symbol, SymbolState())
+    else:
+        with _lock_for(symbol):
+            with _meta_lock:
+                symbol_state[symbol] = SymbolState()
+    _state_json_cache.pop("real", None)
     log.info(f"[{symbol}] MANUAL RESET to FLAT")
     return jsonify({"status": "ok", "symbol": symbol, "state": "FLAT"}), 200
 
@@ -2631,40 +3764,79 @@ def reset_symbol(symbol):
 def sim_reset_symbol(symbol):
     """Emergency manual reset of a sim symbol to FLAT."""
     symbol = symbol.upper()
-    with sim_state_lock:
-        sim_symbol_state[symbol] = {"state": "FLAT"}
+    if _redis is not None:
+        _redis_put(_SIM_STATE_KEY, symbol, SymbolState())
+    else:
+        with _sim_lock_for(symbol):
+            with _meta_lock:
+                sim_symbol_state[symbol] = SymbolState()
+    _state_json_cache.pop("sim", None)
     log.info(f"[SIM:{symbol}] MANUAL RESET to FLAT")
     return jsonify({"status": "ok", "symbol": symbol, "state": "FLAT", "mode": "sim"}), 200
 
 
+@app.route("/status/<job_id>", methods=["GET"])
+def job_status(job_id):
+    """Report a queued COVER job: pending / running / done (with result) / failed."""
+    with _jobs_lock:
+        future = _jobs.get(job_id)
+    if future is None:
+        return jsonify({"error": "unknown job", "job_id": job_id}), 404
+    if not future.done():
+        return jsonify({"job_id": job_id,
+                        "state": "running" if future.running() else "pending"}), 200
+    exc = future.exception()
+    if exc is not None:
+        return jsonify({"job_id": job_id, "state": "failed", "error": str(exc)}), 200
+    return jsonify({"job_id": job_id, "state": "done", "result": future.result()}), 200
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # REAL ACCOUNT — /webhook
 # ══════════════════════════════════════════════════════════════════════════════
 @app.route("/webhook", methods=["POST"])
 def webhook():
-    log.info("=" * 60)
-    log.info("WEBHOOK RECEIVED")
-    log.info(f"  headers: {dict(request.headers)}")
-    log.info(f"  raw body: {request.data.decode('utf-8', errors='replace')[:1000]}")
-
+    # Verbose request dump only when troubleshooting (LOG_LEVEL=DEBUG); the
+    # per-webhook INFO line is the "action=… | state=…" summary below.
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("WEBHOOK RECEIVED")
+        log.debug("  headers: %s", dict(request.headers))
+        log.debug("  raw body: %s", request.data.decode('utf-8', errors='replace')[:1000])
+
+    # One orjson pass over the raw bytes, whatever Content-Type QC sent. The
+    # str branch only fires for a double-encoded body ("\"{...}\""), which
+    # Notify.Web has produced in the past — a normal object body parses once.
     try:
-        body = request.get_json(force=True)
+        body = orjson.loads(request.get_data(cache=False) or b"{}")
         if isinstance(body, str):
-            body = json.loads(body)
-    except Exception as e:
-        log.error(f"  Parse error: {e}")
+            body = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        log.error("  Parse error: %s", e)
+        return jsonify({"error": "invalid JSON"}), 400
+    if not isinstance(body, dict):
+        log.error("  Parse error: expected JSON object, got %s", type(body).__name__)
         return jsonify({"error": "invalid JSON"}), 400
+    try:
+        validate_webhook(body)
+    except fastjsonschema.JsonSchemaException as e:
+        log.error("  Invalid payload: %s", e.message)
+        return jsonify({"error": "invalid payload", "detail": e.message}), 400
 
-    log.info(f"  parsed: {json.dumps(body)}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("  parsed: %s", orjson.dumps(body).decode())
 
-    action      = str(body.get("action", "")).upper()
-    qc_symbol   = str(body.get("symbol", "")).upper().strip().split()[0]
-    quantity    = int(body.get("quantity", 0))
-    price       = float(body.get("price", 0))
-    cycle       = int(body.get("cycle", 1))
-    # Optional SL pct from QC payload; falls back to DEFAULT_SL_PCT if absent.
-    sl_pct_raw  = body.get("sl_pct")
-    sl_pct      = float(sl_pct_raw) if sl_pct_raw is not None else DEFAULT_SL_PCT
+    action      = body["action"].upper()
+    qc_symbol   = (body["symbol"].upper().split() or [""])[0]
+    try:
+        quantity    = int(body.get("quantity", 0))
+        price       = float(body.get("price", 0))
+        cycle       = int(body.get("cycle", 1))
+        # Optional SL pct from QC payload; falls back to DEFAULT_SL_PCT if absent.
+        sl_pct_raw  = body.get("sl_pct")
+        sl_pct      = float(sl_pct_raw) if sl_pct_raw is not None else DEFAULT_SL_PCT
+    except ValueError as e:
+        log.error("  Invalid payload: %s", e)
+        return jsonify({"error": "invalid payload", "detail": str(e)}), 400
     # Ownership tag: which QC strategy sent this. Used to stamp owner on SHORT and
     # to reject stray COVERs from a non-owning strategy. Empty → guards no-op.
     strategy    = str(body.get("strategy") or body.get("slot") or "").lower()
@@ -2674,73 +3846,88 @@ def webhook():
 
     symbol = resolve_symbol(qc_symbol)
     if symbol != qc_symbol:
-        log.info(f"[{qc_symbol}→{symbol}] Ticker resolved")
+        log.info("[%s→%s] Ticker resolved", qc_symbol, symbol)
+
+    dedup_key = ("real", cycle, action, symbol) if "cycle" in body else None
+    if action in ("SHORT", "COVER"):
+        cached = dedup_lookup(dedup_key)
+        if cached:
+            log.info("[%s] %s cycle=%s is a duplicate — returning cached response",
+                     symbol, action, cycle)
+            return jsonify({**cached[0], "dedup": True}), cached[1]
+    burst_key = ("real", action, symbol, quantity, round(price, 4))
+    if seen_recently(burst_key):
+        log.info("[%s] %s qty=%s price=$%s repeated within %ss — ignored",
+                 symbol, action, quantity, price, BURST_WINDOW)
+        return jsonify({"status": "ignored", "reason": "duplicate"}), 200
 
     s             = get_state(symbol)
-    current_state = s.get("state", "FLAT")
+    current_state = s.state
 
-    log.info(f"[{symbol}] action={action} | state={current_state} | "
-             f"qty={quantity} | price=${price}")
+    _log_info("[%s] action=%s | state=%s | qty=%s | price=$%s",
+              symbol, action, current_state, quantity, price)
 
     # ── SHORT ────────────────────────────────────────────────────────────────
     if action == "SHORT":
         if current_state == "BLOCKED":
-            last_cycle = s.get("cycle", 0)
+            last_cycle = s.cycle
             if cycle > last_cycle:
-                log.info(f"[{symbol}] BLOCKED lifted — new cycle {cycle} > last cycle {last_cycle}")
+                log.info("[%s] BLOCKED lifted — new cycle %s > last cycle %s",
+                         symbol, cycle, last_cycle)
                 set_state(symbol, state="FLAT")
                 current_state = "FLAT"
             else:
-                log.info(f"[{symbol}] SHORT ignored — blocked today (cycle={cycle}, last={last_cycle}): {s.get('reason', '')}")
+                log.info("[%s] SHORT ignored — blocked today (cycle=%s, last=%s): %s",
+                         symbol, cycle, last_cycle, s.reason)
                 return jsonify({"status": "ignored", "reason": "blocked", "cycle": cycle, "last_cycle": last_cycle}), 200
 
         if current_state == "LOCATING":
-            log.warning(f"[{symbol}] SHORT ignored — locate already in progress")
+            log.warning("[%s] SHORT ignored — locate already in progress", symbol)
             return jsonify({"status": "ignored", "reason": "locate in progress"}), 200
 
         if current_state == "ACTIVE":
             # SOFT-IGNORE: do NOT block() here. block() poisons the symbol so the
             # holder's own later COVER gets ignored → orphaned position. Just drop
             # the duplicate and leave the existing position/state fully intact.
-            log.info(f"[{symbol}] SHORT ignored — symbol busy (already ACTIVE); "
-                     f"leaving holder's position untouched")
+            log.info("[%s] SHORT ignored — symbol busy (already ACTIVE); "
+                     "leaving holder's position untouched",
+                     symbol)
             return jsonify({"status": "ignored", "reason": "symbol busy (already active)"}), 200
 
         if quantity <= 0 or price <= 0:
             return jsonify({"error": "quantity and price required for SHORT"}), 400
 
         set_state(symbol, state="LOCATING", entry_price=price, quantity=quantity, cycle=cycle, sl_pct=sl_pct, owner=strategy)
-        threading.Thread(target=locate_and_short, args=(symbol, quantity, price), daemon=True).start()
-        log.info(f"[{symbol}] Locate thread launched — returning 200 immediately")
-        return jsonify({"status": "ok", "action": "SHORT", "symbol": symbol, "state": "LOCATING"}), 200
+        _locate_pool.submit(_run_task, locate_and_short, symbol, quantity, price)
+        log.info("[%s] Locate queued — returning 200 immediately", symbol)
+        resp = {"status": "ok", "action": "SHORT", "symbol": symbol, "state": "LOCATING"}
+        dedup_remember(dedup_key, resp, 200)
+        return jsonify(resp), 200
 
     # ── COVER ────────────────────────────────────────────────────────────────
     elif action == "COVER":
         if current_state == "BLOCKED":
-            log.info(f"[{symbol}] COVER ignored — blocked today: {s.get('reason', '')}")
+            log.info("[%s] COVER ignored — blocked today: %s", symbol, s.reason)
             return jsonify({"status": "ignored", "reason": "blocked"}), 200
 
         if current_state == "FLAT":
-            log.warning(f"[{symbol}] COVER rejected — no position to cover (FLAT)")
+            log.warning("[%s] COVER rejected — no position to cover (FLAT)", symbol)
             block(symbol, "COVER received with no active position")
             return jsonify({"status": "rejected", "reason": "no position"}), 200
 
         if current_state == "LOCATING":
-            log.warning(f"[{symbol}] COVER received during locate — cancelling and cleaning up")
-            threading.Thread(
-                target=cancel_and_cleanup,
-                args=(symbol, "COVER received while still locating"),
-                daemon=True
-            ).start()
+            log.warning("[%s] COVER received during locate — cancelling and cleaning up", symbol)
+            _cleanup_pool.submit(_run_task, cancel_and_cleanup, symbol, "COVER received while still locating")
             return jsonify({"status": "ok", "action": "cleanup_on_cover_during_locate"}), 200
 
         # OWNERSHIP GUARD: a skipped strategy's QC algo still fires a fire-and-forget
         # COVER. If it isn't the strategy that opened this position, ignore it so it
         # can't flatten the real holder. Empty owner/strategy → no-op (back-compat).
-        owner = s.get("owner")
+        owner = s.owner
         if owner and strategy and strategy != owner:
-            log.info(f"[{symbol}] COVER ignored — strategy '{strategy}' is not owner "
-                     f"'{owner}'; leaving holder's position untouched")
+            log.info("[%s] COVER ignored — strategy '%s' is not owner '%s'; "
+                     "leaving holder's position untouched",
+                     symbol, strategy, owner)
             return jsonify({"status": "ignored", "reason": "not position owner",
                             "owner": owner, "strategy": strategy}), 200
 
@@ -2749,114 +3936,68 @@ def webhook():
         # ticker), bail here so exactly one buy is placed and we never over-cover
         # the short into a long.
         if not try_begin_cover(symbol):
-            log.info(f"[{symbol}] COVER ignored — cover already in progress")
+            log.info("[%s] COVER ignored — cover already in progress", symbol)
             return jsonify({"status": "ignored", "reason": "cover in progress"}), 200
 
-        log.info(f"[{symbol}] COVER: looking up actual position size from TZ")
-        try:
-            position = get_position(symbol)
-        except Exception as e:
-            log.error(f"[{symbol}] COVER position lookup failed: {e}")
-            set_state(symbol, state="ACTIVE", reason="cover lookup failed")  # un-claim
-            return jsonify({"error": str(e)}), 500
-
-        if position is None:
-            log.warning(f"[{symbol}] COVER: no TZ position found — entry may not have filled")
-            block(symbol, "COVER received but no TZ position found")
-            return jsonify({"status": "ok", "note": "no position found — blocked"}), 200
-
-        shares = float(position.get("shares", 0))
-        if shares >= 0:
-            log.warning(f"[{symbol}] COVER: position shares={shares} — not a short | blocking")
-            block(symbol, f"COVER received but position is not short (shares={shares})")
-            return jsonify({"status": "ok", "note": "not a short position"}), 200
-
-        cover_qty   = abs(int(shares))
-        cover_limit = float(price)
-
-        log.info(f"[{symbol}] Covering {cover_qty} shares | "
-                 f"qc_price=${price} | limit=${cover_limit} (QC pre-buffered)")
-
-        # Cancel any armed broker SL stop before placing the cover.
-        # The stop is on the same short position; if it remained active, the
-        # cover would attempt to flatten and the stop would still try to fire
-        # on adverse moves, potentially producing a second buy order.
-        stop_id = s.get("sl_client_order_id")
-        if stop_id:
-            cancel_real_stop(symbol, stop_id)
-            set_state(symbol, sl_client_order_id=None)
-
-        try:
-            result = place_order("Buy", symbol, cover_qty, cover_limit, "COVER_ORDER")
-            set_state(symbol, state="FLAT", reason="covered", owner=None)
-            log.info(f"[{symbol}] COVER PLACED | qty={cover_qty} | limit=${cover_limit} | "
-                     f"clientOrderId={result.get('clientOrderId')} | "
-                     f"status={result.get('orderStatus')}")
-            threading.Thread(
-                target=monitor_cover_fill,
-                args=(symbol, result.get("clientOrderId"), COVER_FILL_TIMEOUT),
-                daemon=True
-            ).start()
-            return jsonify({
-                "status":        "ok",
-                "action":        "COVER",
-                "symbol":        symbol,
-                "quantity":      cover_qty,
-                "limit_price":   cover_limit,
-                "clientOrderId": result.get("clientOrderId"),
-                "orderStatus":   result.get("orderStatus"),
-            }), 200
-        except Exception as e:
-            log.error(f"[{symbol}] Cover order failed: {e}")
-            set_state(symbol, state="ACTIVE", reason="cover failed")  # un-claim so a retry can proceed
-            return jsonify({"error": str(e)}), 500
+        job_id = submit_job(execute_cover, symbol, price)
+        log.info("[%s] COVER queued as job %s — returning 202 immediately", symbol, job_id)
+        resp = {"status": "queued", "action": "COVER", "symbol": symbol, "job_id": job_id}
+        dedup_remember(dedup_key, resp, 202)
+        dedup_track_cover(dedup_key, job_id, burst_key, ("real", cycle, "SHORT", symbol))
+        return jsonify(resp), 202
 
     # ── CANCEL ───────────────────────────────────────────────────────────────
-    elif action == "CANCEL":
-        log.info(f"[{symbol}] CANCEL received — cancelling orders and closing any position")
-        threading.Thread(
-            target=cancel_and_cleanup,
-            args=(symbol, "CANCEL signal received from QC"),
-            daemon=True
-        ).start()
+    else:   # CANCEL — the schema pattern only admits SHORT / COVER / CANCEL
+        log.info("[%s] CANCEL received — cancelling orders and closing any position", symbol)
+        _cleanup_pool.submit(_run_task, cancel_and_cleanup, symbol, "CANCEL signal received from QC")
         return jsonify({"status": "ok", "action": "CANCEL", "symbol": symbol}), 200
 
-    else:
-        log.warning(f"[{symbol}] Unknown action: {action}")
-        return jsonify({"error": f"unknown action: {action}"}), 400
-
 
 # ══════════════════════════════════════════════════════════════════════════════
 # SIM ACCOUNT — /sim/webhook
 # ══════════════════════════════════════════════════════════════════════════════
 @app.route("/sim/webhook", methods=["POST"])
 def sim_webhook():
-    log.info("=" * 60)
-    log.info("SIM WEBHOOK RECEIVED")
-    log.info(f"  raw body: {request.data.decode('utf-8', errors='replace')[:1000]}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("SIM WEBHOOK RECEIVED")
+        log.debug("  raw body: %s", request.data.decode('utf-8', errors='replace')[:1000])
 
     if not SIM_API_KEY or not SIM_API_SECRET or not SIM_ACCOUNT_ID:
         log.error("SIM credentials not configured — set TZ_SIM_API_KEY, TZ_SIM_API_SECRET, SIM_ACCOUNT_ID")
         return jsonify({"error": "sim credentials not configured — check Render env vars"}), 503
 
+    # Single-pass parse — see /webhook.
     try:
-        body = request.get_json(force=True)
+        body = orjson.loads(request.get_data(cache=False) or b"{}")
         if isinstance(body, str):
-            body = json.loads(body)
-    except Exception as e:
-        log.error(f"  Parse error: {e}")
+            body = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        log.error("  Parse error: %s", e)
+        return jsonify({"error": "invalid JSON"}), 400
+    if not isinstance(body, dict):
+        log.error("  Parse error: expected JSON object, got %s", type(body).__name__)
         return jsonify({"error": "invalid JSON"}), 400
+    try:
+        validate_webhook(body)
+    except fastjsonschema.JsonSchemaException as e:
+        log.error("  Invalid payload: %s", e.message)
+        return jsonify({"error": "invalid payload", "detail": e.message}), 400
 
-    log.info(f"  parsed: {json.dumps(body)}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("  parsed: %s", orjson.dumps(body).decode())
 
-    action    = str(body.get("action", "")).upper()
-    qc_symbol = str(body.get("symbol", "")).upper().strip().split()[0]
-    quantity  = int(body.get("quantity", 0))
-    price     = float(body.get("price", 0))
-    cycle     = int(body.get("cycle", 1))
-    # Optional SL pct from QC payload; falls back to DEFAULT_SL_PCT if absent.
-    sl_pct_raw = body.get("sl_pct")
-    sl_pct     = float(sl_pct_raw) if sl_pct_raw is not None else DEFAULT_SL_PCT
+    action    = body["action"].upper()
+    qc_symbol = (body["symbol"].upper().split() or [""])[0]
+    try:
+        quantity   = int(body.get("quantity", 0))
+        price      = float(body.get("price", 0))
+        cycle      = int(body.get("cycle", 1))
+        # Optional SL pct from QC payload; falls back to DEFAULT_SL_PCT if absent.
+        sl_pct_raw = body.get("sl_pct")
+        sl_pct     = float(sl_pct_raw) if sl_pct_raw is not None else DEFAULT_SL_PCT
+    except ValueError as e:
+        log.error("  Invalid payload: %s", e)
+        return jsonify({"error": "invalid payload", "detail": str(e)}), 400
     # Ownership tag (see real /webhook). Empty → guards no-op.
     strategy   = str(body.get("strategy") or body.get("slot") or "").lower()
 
@@ -2865,161 +4006,114 @@ def sim_webhook():
 
     symbol = resolve_symbol(qc_symbol)
     if symbol != qc_symbol:
-        log.info(f"[SIM:{qc_symbol}→{symbol}] Ticker resolved")
+        log.info("[SIM:%s→%s] Ticker resolved", qc_symbol, symbol)
+
+    dedup_key = ("sim", cycle, action, symbol) if "cycle" in body else None
+    if action in ("SHORT", "COVER"):
+        cached = dedup_lookup(dedup_key)
+        if cached:
+            log.info("[SIM:%s] %s cycle=%s is a duplicate — returning cached response",
+                     symbol, action, cycle)
+            return jsonify({**cached[0], "dedup": True}), cached[1]
+    burst_key = ("sim", action, symbol, quantity, round(price, 4))
+    if seen_recently(burst_key):
+        log.info("[SIM:%s] %s qty=%s price=$%s repeated within %ss — ignored",
+                 symbol, action, quantity, price, BURST_WINDOW)
+        return jsonify({"status": "ignored", "reason": "duplicate", "mode": "sim"}), 200
 
     s             = sim_get_state(symbol)
-    current_state = s.get("state", "FLAT")
+    current_state = s.state
 
-    log.info(f"[SIM:{symbol}] action={action} | state={current_state} | "
-             f"qty={quantity} | price=${price} | cycle={cycle}")
+    _log_info("[SIM:%s] action=%s | state=%s | qty=%s | price=$%s | cycle=%s",
+              symbol, action, current_state, quantity, price, cycle)
 
     # ── SHORT ────────────────────────────────────────────────────────────────
     if action == "SHORT":
         if current_state == "BLOCKED":
-            last_cycle = s.get("cycle", 0)
+            last_cycle = s.cycle
             if cycle > last_cycle:
-                log.info(f"[SIM:{symbol}] BLOCKED lifted — new cycle {cycle} > last {last_cycle}")
+                log.info("[SIM:%s] BLOCKED lifted — new cycle %s > last %s",
+                         symbol, cycle, last_cycle)
                 sim_set_state(symbol, state="FLAT")
                 current_state = "FLAT"
             else:
-                log.info(f"[SIM:{symbol}] SHORT ignored — blocked "
-                         f"(cycle={cycle} last={last_cycle}): {s.get('reason', '')}")
+                log.info("[SIM:%s] SHORT ignored — blocked (cycle=%s last=%s): %s",
+                         symbol, cycle, last_cycle, s.reason)
                 return jsonify({
                     "status": "ignored", "reason": "blocked",
                     "cycle": cycle, "last_cycle": last_cycle, "mode": "sim",
                 }), 200
 
         if current_state == "LOCATING":
-            log.warning(f"[SIM:{symbol}] SHORT ignored — locate already in progress")
+            log.warning("[SIM:%s] SHORT ignored — locate already in progress", symbol)
             return jsonify({"status": "ignored", "reason": "locate in progress", "mode": "sim"}), 200
 
         if current_state == "ACTIVE":
             # SOFT-IGNORE (see real /webhook): never sim_block() on a duplicate —
             # it would orphan the holder's position when its own COVER arrives.
-            log.info(f"[SIM:{symbol}] SHORT ignored — symbol busy (already ACTIVE); "
-                     f"leaving holder's position untouched")
+            log.info("[SIM:%s] SHORT ignored — symbol busy (already ACTIVE); "
+                     "leaving holder's position untouched",
+                     symbol)
             return jsonify({"status": "ignored", "reason": "symbol busy (already active)", "mode": "sim"}), 200
 
         if quantity <= 0 or price <= 0:
             return jsonify({"error": "quantity and price required for SHORT"}), 400
 
         sim_set_state(symbol, state="LOCATING", entry_price=price, quantity=quantity, cycle=cycle, sl_pct=sl_pct, owner=strategy)
-        threading.Thread(
-            target=locate_and_short_sim, args=(symbol, quantity, price), daemon=True
-        ).start()
-        return jsonify({
+        _locate_pool.submit(_run_task, locate_and_short_sim, symbol, quantity, price)
+        resp = {
             "status": "ok", "action": "SHORT", "symbol": symbol,
             "state": "LOCATING", "mode": "sim",
-        }), 200
+        }
+        dedup_remember(dedup_key, resp, 200)
+        return jsonify(resp), 200
 
     # ── COVER ────────────────────────────────────────────────────────────────
     elif action == "COVER":
         if current_state == "BLOCKED":
-            log.info(f"[SIM:{symbol}] COVER ignored — blocked: {s.get('reason', '')}")
+            log.info("[SIM:%s] COVER ignored — blocked: %s", symbol, s.reason)
             return jsonify({"status": "ignored", "reason": "blocked", "mode": "sim"}), 200
 
         if current_state == "FLAT":
-            log.warning(f"[SIM:{symbol}] COVER rejected — no position (FLAT)")
+            log.warning("[SIM:%s] COVER rejected — no position (FLAT)", symbol)
             sim_block(symbol, "COVER received with no active position")
             return jsonify({"status": "rejected", "reason": "no position", "mode": "sim"}), 200
 
         if current_state == "LOCATING":
-            log.warning(f"[SIM:{symbol}] COVER during locate — cancelling")
-            threading.Thread(
-                target=sim_cancel_and_cleanup,
-                args=(symbol, "COVER received while still locating"),
-                daemon=True,
-            ).start()
+            log.warning("[SIM:%s] COVER during locate — cancelling", symbol)
+            _cleanup_pool.submit(_run_task, sim_cancel_and_cleanup, symbol, "COVER received while still locating")
             return jsonify({
                 "status": "ok", "action": "cleanup_on_cover_during_locate", "mode": "sim"
             }), 200
 
         # OWNERSHIP GUARD (see real /webhook)
-        owner = s.get("owner")
+        owner = s.owner
         if owner and strategy and strategy != owner:
-            log.info(f"[SIM:{symbol}] COVER ignored — strategy '{strategy}' is not owner "
-                     f"'{owner}'; leaving holder's position untouched")
+            log.info("[SIM:%s] COVER ignored — strategy '%s' is not owner '%s'; "
+                     "leaving holder's position untouched",
+                     symbol, strategy, owner)
             return jsonify({"status": "ignored", "reason": "not position owner",
                             "owner": owner, "strategy": strategy, "mode": "sim"}), 200
 
         # DOUBLE-BUY GUARD (see real /webhook)
         if not sim_try_begin_cover(symbol):
-            log.info(f"[SIM:{symbol}] COVER ignored — cover already in progress")
+            log.info("[SIM:%s] COVER ignored — cover already in progress", symbol)
             return jsonify({"status": "ignored", "reason": "cover in progress", "mode": "sim"}), 200
 
-        try:
-            position = sim_get_position(symbol)
-        except Exception as e:
-            log.error(f"[SIM:{symbol}] COVER position lookup failed: {e}")
-            sim_set_state(symbol, state="ACTIVE", reason="cover lookup failed")  # un-claim
-            return jsonify({"error": str(e), "mode": "sim"}), 500
-
-        if position is None:
-            log.warning(f"[SIM:{symbol}] COVER: no sim position found")
-            sim_block(symbol, "COVER received but no sim position found")
-            return jsonify({"status": "ok", "note": "no position found — blocked", "mode": "sim"}), 200
-
-        shares = float(position.get("shares", 0))
-        if shares >= 0:
-            log.warning(f"[SIM:{symbol}] COVER: not a short (shares={shares})")
-            sim_block(symbol, f"COVER but position is not short (shares={shares})")
-            return jsonify({"status": "ok", "note": "not a short position", "mode": "sim"}), 200
-
-        cover_qty    = abs(int(shares))
-        cover_limit  = float(price)
-        phantom_cost = s.get("phantom_locate_cost", 0)
-
-        log.info(f"[SIM:{symbol}] Covering {cover_qty}sh | limit=${cover_limit} | "
-                 f"phantom_locate_cost=${phantom_cost:.2f}")
-
-        # Cancel armed sim broker SL stop before placing the cover
-        stop_id = s.get("sl_client_order_id")
-        if stop_id:
-            cancel_sim_stop(symbol, stop_id)
-            sim_set_state(symbol, sl_client_order_id=None)
-
-        try:
-            result = sim_place_order("Buy", symbol, cover_qty, cover_limit, "SIM_COVER_ORDER")
-            sim_set_state(symbol, state="FLAT", reason="covered", owner=None)
-            log.info(f"[SIM:{symbol}] COVER PLACED | qty={cover_qty} | limit=${cover_limit} | "
-                     f"clientOrderId={result.get('clientOrderId')} | "
-                     f"status={result.get('orderStatus')} | "
-                     f"phantom_locate_cost=${phantom_cost:.2f}")
-            threading.Thread(
-                target=sim_monitor_cover_fill,
-                args=(symbol, result.get("clientOrderId"), COVER_FILL_TIMEOUT),
-                daemon=True,
-            ).start()
-            return jsonify({
-                "status":              "ok",
-                "action":              "COVER",
-                "symbol":              symbol,
-                "mode":                "sim",
-                "quantity":            cover_qty,
-                "limit_price":         cover_limit,
-                "clientOrderId":       result.get("clientOrderId"),
-                "orderStatus":         result.get("orderStatus"),
-                "phantom_locate_cost": round(phantom_cost, 4),
-            }), 200
-        except Exception as e:
-            log.error(f"[SIM:{symbol}] Cover order failed: {e}")
-            sim_set_state(symbol, state="ACTIVE", reason="cover failed")  # un-claim so a retry can proceed
-            return jsonify({"error": str(e), "mode": "sim"}), 500
+        job_id = submit_job(sim_execute_cover, symbol, price)
+        log.info("[SIM:%s] COVER queued as job %s — returning 202 immediately", symbol, job_id)
+        resp = {"status": "queued", "action": "COVER", "symbol": symbol,
+                "job_id": job_id, "mode": "sim"}
+        dedup_remember(dedup_key, resp, 202)
+        dedup_track_cover(dedup_key, job_id, burst_key, ("sim", cycle, "SHORT", symbol))
+        return jsonify(resp), 202
 
     # ── CANCEL ───────────────────────────────────────────────────────────────
-    elif action == "CANCEL":
-        log.info(f"[SIM:{symbol}] CANCEL received")
-        threading.Thread(
-            target=sim_cancel_and_cleanup,
-            args=(symbol, "CANCEL signal from QC"),
-            daemon=True,
-        ).start()
+    else:   # CANCEL (see real /webhook)
+        log.info("[SIM:%s] CANCEL received", symbol)
+        _cleanup_pool.submit(_run_task, sim_cancel_and_cleanup, symbol, "CANCEL signal from QC")
         return jsonify({"status": "ok", "action": "CANCEL", "symbol": symbol, "mode": "sim"}), 200
 
-    else:
-        log.warning(f"[SIM:{symbol}] Unknown action: {action}")
-        return jsonify({"error": f"unknown action: {action}"}), 400
-
 
 # ══════════════════════════════════════════════════════════════════════════════
 # ENTRYPOINT
@@ -3031,6 +4125,10 @@ if __name__ == "__main__":
         log.warning("SIM credentials not set — /sim/webhook will return 503")
 
     port = int(os.environ.get("PORT", 5000))
+    # LOCAL_ONLY=1 → loopback only, for a dev loop where QC runs on this host and
+    # posts to http://127.0.0.1:5000/webhook directly (no ngrok/TLS hop).
+    local_only = os.environ.get("LOCAL_ONLY", "").strip().lower() in ("1", "true", "yes", "on")
+    host = "127.0.0.1" if local_only else "0.0.0.0"
 
     log.info("")
     log.info("╔══════════════════════════════════════════════════════════╗")
@@ -3047,6 +4145,7 @@ if __name__ == "__main__":
     log.info("║  POST /sim/reset/<sym>  ← manually reset sim to FLAT    ║")
     log.info("║                                                          ║")
     log.info("║  GET  /health           ← server + TZ API status        ║")
+    log.info("║  GET  /status/<job_id>  ← result of a queued COVER      ║")
     log.info("╚══════════════════════════════════════════════════════════╝")
     log.info(f"  Real account:      {ACCOUNT_ID}")
     log.info(f"  Real key:          {API_KEY[:8] + '...' if API_KEY else 'NOT SET'}")
@@ -3062,6 +4161,15 @@ if __name__ == "__main__":
     log.info(f"  Locate stepdown:   <1000sh: -100/step | >=1000sh: x{LOCATE_STEPDOWN_FACTOR} (max {LOCATE_MAX_ATTEMPTS} attempts)")
     log.info(f"  Stop-loss:         {'ENABLED — broker SL armed after each fill' if STOP_LOSS_ENABLED else 'DISABLED — relying on QC cover webhook only'}")
     log.info(f"  Price handling:    QC pre-buffered — server uses received price directly")
-    log.info(f"  Listening on port: {port}")
+    log.info(f"  Listening on:      {host}:{port}{'  (LOCAL_ONLY)' if local_only else ''}")
     log.info("")
-    app.run(host="0.0.0.0", port=port, debug=False)
+    try:
+        from gevent.pywsgi import WSGIServer
+    except ImportError:
+        log.warning("gevent not installed — falling back to Flask's dev server")
+        app.run(host=host, port=port, debug=False)
+    else:
+        try:
+            WSGIServer((host, port), app, log=None).serve_forever()
+        finally:
+            shutdown_pools()